@@ -0,0 +1,28 @@
+-- ============================================================================
+-- KOLMO.wiazor.com v.2.1.1 - Migration 004: Covering date index for exports
+-- 
+-- Replaces idx_compute_date_desc with a covering (date DESC) index that
+-- INCLUDEs the columns read by the JSON exporter:
+--   - _get_volatility_for_date  (WHERE date <= $1 ORDER BY date DESC LIMIT 2)
+--   - export_from_database      (WHERE date = $1)
+-- Both become index-only scans (no heap fetches once the table is vacuumed).
+-- 
+-- NOTE: CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block.
+-- Apply with psql directly (autocommit), not via scripts/run_migrations.py:
+--   psql -U postgres -d kolmo_db -f db/migrations/004_compute_date_covering_index.sql
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_compute_date_desc_covering
+    ON mcol1_compute_data (date DESC)
+    INCLUDE (
+        r_me4u, r_iou2, r_uome,
+        relpath_me4u, relpath_iou2, relpath_uome,
+        vol_me4u, vol_iou2, vol_uome,
+        kolmo_deviation, winner
+    );
+
+-- Superseded by the covering index above (same key, same ordering)
+DROP INDEX CONCURRENTLY IF EXISTS idx_compute_date_desc;
+
+COMMENT ON INDEX idx_compute_date_desc_covering IS
+'Covering date index for JSON export queries (volatility lookup, single-date export). Enables index-only scans.';
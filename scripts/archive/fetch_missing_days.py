@@ -85,6 +85,7 @@ class MissingDaysFetcher:
     
     async def close(self) -> None:
         """Close database connection."""
+        await self.provider_manager.aclose()
         if self.pool:
             await self.pool.close()
         logger.info("🔒 Database connection closed")
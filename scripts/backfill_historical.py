@@ -22,6 +22,7 @@ import uuid
 
 import httpx
 import asyncpg
+import orjson
 from dotenv import load_dotenv
 
 # Add src to path for imports
@@ -102,7 +103,7 @@ class HistoricalBackfill:
         try:
             response = await self.http_client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             result = {}
             rates_data = data.get("rates", {})
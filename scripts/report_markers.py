@@ -16,6 +16,7 @@ import sys
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from kolmo.computation.engine import load_sources
 from kolmo.config import Settings
 
 
@@ -42,8 +43,7 @@ async def fetch_latest_markers(pool: asyncpg.Pool) -> list[dict[str, Any]]:
     rows = await pool.fetch(query)
     results: list[dict[str, Any]] = []
     for r in rows:
-        sources = r["sources"] or {}
-        provider = sources.get("provider") if isinstance(sources, dict) else None
+        provider = load_sources(r["sources"]).get("provider")
         results.append({
             "date": r["date"].isoformat(),
             "provider": provider,
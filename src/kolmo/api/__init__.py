@@ -4,6 +4,7 @@ KOLMO API Module
 🔒 NORMATIVE: REST API follows Technical Specification v.2.1.1 Section 6
 """
 
+from kolmo.api.responses import KolmoJSONResponse, model_response
 from kolmo.api.routes import router
 from kolmo.api.schemas import (
     WinnerResponse,
@@ -13,6 +14,8 @@ from kolmo.api.schemas import (
 
 __all__ = [
     "router",
+    "KolmoJSONResponse",
+    "model_response",
     "WinnerResponse",
     "HealthResponse",
     "ErrorResponse",
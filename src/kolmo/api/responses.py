@@ -0,0 +1,54 @@
+"""
+KOLMO API Response Classes
+
+🔒 REQ-6.3: Decimal values are serialized as exact strings, never floats.
+"""
+
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def _orjson_default(obj: Any) -> str:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, (Decimal, UUID)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class KolmoJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson (Decimal/UUID → str).
+    
+    Return it directly from a route when the content holds Decimals. A plain
+    dict returned from a route goes through FastAPI's jsonable_encoder first,
+    which turns Decimal into float before render() ever sees it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Render a response model straight to JSON bytes.
+    
+    Uses the model's compiled pydantic-core serializer, skipping FastAPI's
+    response_model re-validation and the dict → JSON round trip. Routes keep
+    `response_model=` for the OpenAPI schema.
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        status_code=status_code,
+        media_type="application/json"
+    )
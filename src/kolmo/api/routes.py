@@ -10,8 +10,10 @@ from datetime import date, datetime, timezone
 from decimal import Decimal
 
 from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import Response
 
 from kolmo import __version__
+from kolmo.api.responses import model_response
 from kolmo.api.schemas import (
     ErrorDetail,
     ErrorResponse,
@@ -48,7 +50,7 @@ def _format_decimal_6(value: Decimal) -> str:
         500: {"model": ErrorResponse, "description": "Internal server error"},
     }
 )
-async def get_winner_latest() -> WinnerResponse:
+async def get_winner_latest() -> Response:
     """
     🔒 REQ-1.4 & REQ-6.2: GET /api/v1/winner/latest endpoint.
     
@@ -83,12 +85,12 @@ async def get_winner_latest() -> WinnerResponse:
                 }
             )
         
-        return _row_to_response(row)
+        return model_response(_row_to_response(row))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching latest winner: {e}")
+        logger.error("Error fetching latest winner: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -112,7 +114,7 @@ async def get_winner_latest() -> WinnerResponse:
         500: {"model": ErrorResponse, "description": "Internal server error"},
     }
 )
-async def get_rates_by_date(date: date) -> WinnerResponse:
+async def get_rates_by_date(date: date) -> Response:
     """
     🔒 REQ-6.7: GET /api/v1/rates/{date} endpoint.
     
@@ -154,12 +156,12 @@ async def get_rates_by_date(date: date) -> WinnerResponse:
                 }
             )
         
-        return _row_to_response(row)
+        return model_response(_row_to_response(row))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching rates for {date}: {e}")
+        logger.error("Error fetching rates for %s: %s", date, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={
@@ -0,0 +1,204 @@
+"""
+In-process cache for immutable upstream responses.
+
+Rates published for a past date never change, so repeated gap-fill
+triggers can skip both the network round trip and the parse.
+Values are stored as strings to keep Decimal exactness (REQ-2.1).
+
+The cache is best-effort: a failing tier is logged and treated as a miss,
+never as a provider failure.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import date as date_type
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+
+from kolmo.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Past-date rates are immutable; keep them in memory for 30 days
+CACHE_TTL_SECONDS = 86400 * 30
+
+# Only rates this old are persisted to disk (upstreams may republish recent days)
+DISK_CACHE_MIN_AGE_DAYS = 3
+
+
+class LRUCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+
+    Exposes an async get/set interface so it can be swapped for an
+    external store without touching callers.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """Return cached value or None if missing/expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        """Store value, expiring after `ex` seconds if given."""
+        expires_at = time.monotonic() + ex if ex is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def keys(self) -> list[str]:
+        return list(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class DiskCache:
+    """
+    One JSON file per key under `root`: "{provider}:{date}" →
+    root/{provider}/{date}.json. File I/O runs in a worker thread.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root).expanduser()
+
+    def _path(self, key: str) -> Path:
+        provider, _, day = key.partition(":")
+        return self.root / provider / f"{day}.json"
+
+    def _read(self, key: str) -> str | None:
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _write(self, key: str, value: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so readers never see a partial file
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(value, encoding="utf-8")
+        tmp.replace(path)
+
+    def _delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _delete_day(self, day: str) -> None:
+        for path in self.root.glob(f"*/{day}.json"):
+            path.unlink(missing_ok=True)
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._write, key, value)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._delete, key)
+
+    async def delete_day(self, day: str) -> None:
+        await asyncio.to_thread(self._delete_day, day)
+
+
+# Shared by all provider clients in this process
+rates_cache = LRUCache()
+
+
+def _disk_cache() -> DiskCache | None:
+    """Disk tier, enabled by RATES_CACHE_DIR."""
+    cache_dir = get_settings().rates_cache_dir
+    return DiskCache(cache_dir) if cache_dir else None
+
+
+def _age_days(day: str) -> int:
+    return (date_type.today() - date_type.fromisoformat(day)).days
+
+
+async def get_cached_rates(provider: str, day: str) -> dict[str, Decimal | None] | None:
+    """
+    Return cached rates for (provider, day), or None on a miss.
+
+    Memory is checked first, then disk for days old enough to be final.
+    Today and future dates are never cached. An unreadable or corrupt
+    entry is dropped and reported as a miss.
+    """
+    age = _age_days(day)
+    if age < 1:
+        return None
+
+    key = f"{provider}:{day}"
+    disk = _disk_cache() if age >= DISK_CACHE_MIN_AGE_DAYS else None
+    try:
+        raw = await rates_cache.get(key)
+        if raw is None and disk is not None:
+            raw = await disk.get(key)
+            if raw is not None:
+                await rates_cache.set(key, raw, ex=CACHE_TTL_SECONDS)
+        if raw is None:
+            return None
+
+        return {k: Decimal(v) if v is not None else None for k, v in orjson.loads(raw).items()}
+    except Exception as e:
+        logger.warning("⚠️ Dropping unreadable cached rates %s: %s", key, e)
+        await rates_cache.delete(key)
+        if disk is not None:
+            try:
+                await disk.delete(key)
+            except OSError as delete_error:
+                logger.warning("⚠️ Could not delete cached rates %s: %s", key, delete_error)
+        return None
+
+
+async def store_cached_rates(
+    provider: str,
+    day: str,
+    rates: dict[str, Decimal | None]
+) -> None:
+    """Cache rates for a past day (and on disk once the day is final)."""
+    age = _age_days(day)
+    if age < 1:
+        return
+
+    key = f"{provider}:{day}"
+    try:
+        raw = orjson.dumps({k: str(v) if v is not None else None for k, v in rates.items()}).decode()
+        await rates_cache.set(key, raw, ex=CACHE_TTL_SECONDS)
+        if age >= DISK_CACHE_MIN_AGE_DAYS:
+            disk = _disk_cache()
+            if disk is not None:
+                await disk.set(key, raw)
+    except Exception as e:
+        logger.warning("⚠️ Could not cache rates %s: %s", key, e)
+
+
+async def invalidate(day: str) -> None:
+    """Drop every provider's cached rates for `day` (memory and disk)."""
+    suffix = f":{day}"
+    for key in rates_cache.keys():
+        if key.endswith(suffix):
+            await rates_cache.delete(key)
+    disk = _disk_cache()
+    if disk is not None:
+        try:
+            await disk.delete_day(day)
+        except OSError as e:
+            logger.warning("⚠️ Could not invalidate disk-cached rates for %s: %s", day, e)
@@ -8,7 +8,10 @@ Computation Engine - Orchestrate KOLMO metric computation
 import logging
 from datetime import date as date_type
 from decimal import Decimal
-from uuid import UUID, uuid4
+from typing import Any
+from uuid import UUID
+
+import orjson
 
 from kolmo.computation.transformer import RateTransformer
 from kolmo.computation.calculator import KOLMOCalculator
@@ -19,10 +22,90 @@ from kolmo.models import (
     ExternalDataCreate,
     KolmoRates,
     WinnerReason,
+    next_uuid4,
 )
 
 logger = logging.getLogger(__name__)
 
+def encode_sources(sources: dict[str, Any]) -> str:
+    """
+    Pre-encode the `sources` audit dict for the JSONB column.
+    
+    Floats are rejected: audit metadata must stay exact (REQ-2.1), so
+    numeric values belong in sources as strings.
+    """
+    def _reject(obj: Any) -> Any:
+        raise TypeError(f"Unsupported type in sources: {type(obj).__name__}")
+    
+    # orjson serializes floats natively at any depth, so check the whole tree
+    stack: list[Any] = [sources]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            raise TypeError("float values are not allowed in sources; use str")
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return orjson.dumps(sources, default=_reject).decode()
+
+
+def load_sources(raw: str | bytes | dict[str, Any] | None) -> dict[str, Any]:
+    """Decode a `sources` value read back from mcol1_external_data."""
+    if raw is None:
+        return {}
+    if isinstance(raw, dict):
+        return raw
+    return orjson.loads(raw)
+
+
+# Rows per COPY frame for batch persistence
+COPY_BATCH_SIZE = 1000
+
+_EXTERNAL_COLUMNS = (
+    "date", "eur_usd", "eur_usd_pair_desc",
+    "eur_cny", "eur_cny_pair_desc",
+    "eur_rub", "eur_rub_pair_desc",
+    "eur_inr", "eur_inr_pair_desc",
+    "eur_aed", "eur_aed_pair_desc",
+    "mcol1_snapshot_id", "trace_id", "sources",
+)
+_EXTERNAL_UPDATE = """
+    eur_usd = EXCLUDED.eur_usd,
+    eur_cny = EXCLUDED.eur_cny,
+    eur_rub = EXCLUDED.eur_rub,
+    eur_inr = EXCLUDED.eur_inr,
+    eur_aed = EXCLUDED.eur_aed,
+    sources = EXCLUDED.sources,
+    updated_at = NOW()
+"""
+
+_COMPUTE_COLUMNS = (
+    "date", "r_me4u", "r_iou2", "r_uome",
+    "kolmo_value", "kolmo_deviation", "kolmo_state",
+    "dist_me4u", "dist_iou2", "dist_uome",
+    "relpath_me4u", "relpath_iou2", "relpath_uome",
+    "winner", "winner_reason",
+    "mcol1_snapshot_id", "mcol1_snapshot_compute_id", "trace_compute_id",
+)
+_COMPUTE_UPDATE = """
+    r_me4u = EXCLUDED.r_me4u,
+    r_iou2 = EXCLUDED.r_iou2,
+    r_uome = EXCLUDED.r_uome,
+    kolmo_value = EXCLUDED.kolmo_value,
+    kolmo_deviation = EXCLUDED.kolmo_deviation,
+    kolmo_state = EXCLUDED.kolmo_state,
+    dist_me4u = EXCLUDED.dist_me4u,
+    dist_iou2 = EXCLUDED.dist_iou2,
+    dist_uome = EXCLUDED.dist_uome,
+    relpath_me4u = EXCLUDED.relpath_me4u,
+    relpath_iou2 = EXCLUDED.relpath_iou2,
+    relpath_uome = EXCLUDED.relpath_uome,
+    winner = EXCLUDED.winner,
+    winner_reason = EXCLUDED.winner_reason,
+    updated_at = NOW()
+"""
+
 
 class ComputationEngine:
     """
@@ -43,7 +126,8 @@ class ComputationEngine:
     
     async def compute_daily_metrics(
         self,
-        external_data: ExternalDataCreate
+        external_data: ExternalDataCreate,
+        prev_distances: dict[str, Decimal | None] | None = None
     ) -> ComputeDataCreate:
         """
         🔒 REQ-3.2: Compute all KOLMO metrics from raw external data.
@@ -52,11 +136,13 @@ class ComputationEngine:
         
         Args:
             external_data: Raw provider data from mcol1_external_data
+            prev_distances: Previous day's distances when already known
+                (e.g. chained through a backfill); looked up in the DB if omitted
         
         Returns:
             ComputeDataCreate ready for persistence
         """
-        logger.info(f"Computing KOLMO metrics for {external_data.date}")
+        logger.info("Computing KOLMO metrics for %s", external_data.date)
         
         # Step 1: Transform rates to KOLMO notation
         rates = self.transformer.transform(
@@ -64,8 +150,8 @@ class ComputationEngine:
             eur_cny=external_data.eur_cny
         )
         logger.debug(
-            f"Transformed rates: ME4U={rates.r_me4u}, "
-            f"IOU2={rates.r_iou2}, UOME={rates.r_uome}"
+            "Transformed rates: ME4U=%s, IOU2=%s, UOME=%s",
+            rates.r_me4u, rates.r_iou2, rates.r_uome
         )
         
         # Step 2: Compute KOLMO invariant (exact decimal)
@@ -75,18 +161,19 @@ class ComputationEngine:
         kolmo_deviation = self.calculator.compute_deviation(kolmo_value)
         kolmo_state = self.calculator.compute_state(kolmo_value)
         logger.debug(
-            f"KOLMO: value={kolmo_value}, deviation={kolmo_deviation}, "
-            f"state={kolmo_state}"
+            "KOLMO: value=%s, deviation=%s, state=%s",
+            kolmo_value, kolmo_deviation, kolmo_state
         )
         
         # Step 3: Compute distances
         dist_me4u, dist_iou2, dist_uome = self.calculator.compute_distances(rates)
         logger.debug(
-            f"Distances: ME4U={dist_me4u}, IOU2={dist_iou2}, UOME={dist_uome}"
+            "Distances: ME4U=%s, IOU2=%s, UOME=%s", dist_me4u, dist_iou2, dist_uome
         )
         
         # Step 4: Get previous day's distances for RelativePath
-        prev_distances = await self._get_previous_distances(external_data.date)
+        if prev_distances is None:
+            prev_distances = await self._get_previous_distances(external_data.date)
         
         # Step 5: Compute RelativePaths
         relpath_me4u, relpath_iou2, relpath_uome = \
@@ -97,8 +184,8 @@ class ComputationEngine:
                 prev_distances.get("dist_uome")
             )
         logger.debug(
-            f"RelativePaths: ME4U={relpath_me4u}, IOU2={relpath_iou2}, "
-            f"UOME={relpath_uome}"
+            "RelativePaths: ME4U=%s, IOU2=%s, UOME=%s",
+            relpath_me4u, relpath_iou2, relpath_uome
         )
         
         # Step 6: Select winner
@@ -106,8 +193,8 @@ class ComputationEngine:
             relpath_me4u, relpath_iou2, relpath_uome
         )
         logger.info(
-            f"Winner selected: {winner.value} "
-            f"(rule: {winner_reason.selection_rule.value})"
+            "Winner selected: %s (rule: %s)",
+            winner.value, winner_reason.selection_rule.value
         )
         
         # Build compute data
@@ -128,8 +215,8 @@ class ComputationEngine:
             winner=winner,
             winner_reason=winner_reason,
             mcol1_snapshot_id=external_data.mcol1_snapshot_id,
-            mcol1_snapshot_compute_id=uuid4(),
-            trace_compute_id=uuid4()
+            mcol1_snapshot_compute_id=next_uuid4(),
+            trace_compute_id=next_uuid4()
         )
     
     async def _get_previous_distances(
@@ -161,7 +248,7 @@ class ComputationEngine:
                         "dist_uome": Decimal(str(row["dist_uome"]))
                     }
         except Exception as e:
-            logger.warning(f"Could not fetch previous distances: {e}")
+            logger.warning("Could not fetch previous distances: %s", e)
         
         return {
             "dist_me4u": None,
@@ -209,9 +296,9 @@ async def persist_external_data(data: ExternalDataCreate) -> None:
             data.eur_aed_pair_desc.value if data.eur_aed_pair_desc else None,
             data.mcol1_snapshot_id,
             data.trace_id,
-            data.sources
+            encode_sources(data.sources)
         )
-    logger.info(f"Persisted external data for {data.date}")
+    logger.info("Persisted external data for %s", data.date)
 
 
 async def persist_compute_data(data: ComputeDataCreate) -> None:
@@ -268,4 +355,104 @@ async def persist_compute_data(data: ComputeDataCreate) -> None:
             data.mcol1_snapshot_compute_id,
             data.trace_compute_id
         )
-    logger.info(f"Persisted compute data for {data.date}: winner={data.winner.value}")
+    logger.info("Persisted compute data for %s: winner=%s", data.date, data.winner.value)
+
+
+async def _copy_upsert(
+    table: str,
+    columns: tuple[str, ...],
+    update_sql: str,
+    records: list[tuple]
+) -> None:
+    """
+    COPY records into a transaction-local staging table, then upsert.
+    
+    COPY cannot express ON CONFLICT, so rows land in a temp copy of the
+    target table first; a single INSERT ... SELECT applies them with the
+    same conflict rules as the per-row persist functions.
+    """
+    staging = f"_stage_{table}"
+    cols = ", ".join(columns)
+    async with get_connection() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) "
+                f"ON COMMIT DROP"
+            )
+            await conn.copy_records_to_table(staging, records=records, columns=columns)
+            await conn.execute(
+                f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {staging} "
+                f"ORDER BY date ON CONFLICT (date) DO UPDATE SET {update_sql}"
+            )
+
+
+async def persist_external_data_batch(batch: list[ExternalDataCreate]) -> None:
+    """
+    🔒 REQ-1.2: Store raw provider data for many dates via COPY.
+    
+    Same upsert semantics as persist_external_data; flushed in chunks
+    of COPY_BATCH_SIZE rows.
+    """
+    if not batch:
+        return
+    for start in range(0, len(batch), COPY_BATCH_SIZE):
+        chunk = batch[start:start + COPY_BATCH_SIZE]
+        records = [
+            (
+                d.date,
+                d.eur_usd,
+                d.eur_usd_pair_desc.value if d.eur_usd_pair_desc else None,
+                d.eur_cny,
+                d.eur_cny_pair_desc.value if d.eur_cny_pair_desc else None,
+                d.eur_rub,
+                d.eur_rub_pair_desc.value if d.eur_rub_pair_desc else None,
+                d.eur_inr,
+                d.eur_inr_pair_desc.value if d.eur_inr_pair_desc else None,
+                d.eur_aed,
+                d.eur_aed_pair_desc.value if d.eur_aed_pair_desc else None,
+                d.mcol1_snapshot_id,
+                d.trace_id,
+                encode_sources(d.sources),
+            )
+            for d in chunk
+        ]
+        await _copy_upsert("mcol1_external_data", _EXTERNAL_COLUMNS, _EXTERNAL_UPDATE, records)
+    logger.info("Persisted external data for %s dates (COPY)", len(batch))
+
+
+async def persist_compute_data_batch(batch: list[ComputeDataCreate]) -> None:
+    """
+    🔒 REQ-1.3: Store computed KOLMO metrics for many dates via COPY.
+    
+    Same upsert semantics as persist_compute_data; flushed in chunks
+    of COPY_BATCH_SIZE rows.
+    """
+    if not batch:
+        return
+    for start in range(0, len(batch), COPY_BATCH_SIZE):
+        chunk = batch[start:start + COPY_BATCH_SIZE]
+        records = [
+            (
+                d.date,
+                d.r_me4u,
+                d.r_iou2,
+                d.r_uome,
+                d.kolmo_value,
+                d.kolmo_deviation,
+                d.kolmo_state.value,
+                d.dist_me4u,
+                d.dist_iou2,
+                d.dist_uome,
+                d.relpath_me4u,
+                d.relpath_iou2,
+                d.relpath_uome,
+                d.winner.value,
+                d.winner_reason.model_dump_json(),
+                d.mcol1_snapshot_id,
+                d.mcol1_snapshot_compute_id,
+                d.trace_compute_id,
+            )
+            for d in chunk
+        ]
+        await _copy_upsert("mcol1_compute_data", _COMPUTE_COLUMNS, _COMPUTE_UPDATE, records)
+    logger.info("Persisted compute data for %s dates (COPY)", len(batch))
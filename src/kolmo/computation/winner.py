@@ -43,14 +43,15 @@ class WinnerSelector:
             Tuple of (winner_coin, winner_reason_json)
         """
         # Build candidate dictionary (exclude NULL values)
-        candidates: dict[str, Decimal] = {}
-        
-        if relpath_me4u is not None:
-            candidates["ME4U"] = relpath_me4u
-        if relpath_iou2 is not None:
-            candidates["IOU2"] = relpath_iou2
-        if relpath_uome is not None:
-            candidates["UOME"] = relpath_uome
+        candidates: dict[str, Decimal] = {
+            coin: rp
+            for coin, rp in (
+                ("ME4U", relpath_me4u),
+                ("IOU2", relpath_iou2),
+                ("UOME", relpath_uome),
+            )
+            if rp is not None
+        }
         
         # 🔒 Case 1: All NULL (first day in dataset)
         if not candidates:
@@ -64,30 +65,34 @@ class WinnerSelector:
                 winner=WinnerCoin.IOU2
             )
         
-        # Find maximum RelativePath
-        max_relpath = max(candidates.values())
+        # Shortlist on floats (the WinnerReason values), then decide exactly.
+        # Decimal → float rounding is monotonic, so the exact maximum is
+        # always among the coins whose float equals the float maximum.
+        as_float = {coin: float(rp) for coin, rp in candidates.items()}
+        max_float = max(as_float.values())
+        shortlist = [coin for coin, f in as_float.items() if f == max_float]
         
-        # Get all coins with max value (handle ties)
-        tied_coins = sorted([
-            coin for coin, rp in candidates.items()
-            if rp == max_relpath
-        ])
+        # 🔒 REQ-2.5: Maximum and ties are settled on the exact Decimal values
+        max_relpath = max(candidates[coin] for coin in shortlist)
+        tied_coins = sorted(
+            coin for coin in shortlist if candidates[coin] == max_relpath
+        )
         
         # 🔒 REQ-2.6: Winner is first in alphabetical order
         winner_str = tied_coins[0]
         winner = WinnerCoin(winner_str)
         
         # Determine selection rule
-        if max_relpath > Decimal("0"):
+        if max_relpath > 0:
             rule = SelectionRule.MAX_POSITIVE_ALPHABETICAL_TIEBREAK
         else:
             rule = SelectionRule.LEAST_NEGATIVE
         
         # 🔒 REQ-5.9: Build explainability JSON
         reason = WinnerReason(
-            me4u_relpath=float(relpath_me4u) if relpath_me4u is not None else None,
-            iou2_relpath=float(relpath_iou2) if relpath_iou2 is not None else None,
-            uome_relpath=float(relpath_uome) if relpath_uome is not None else None,
+            me4u_relpath=as_float.get("ME4U"),
+            iou2_relpath=as_float.get("IOU2"),
+            uome_relpath=as_float.get("UOME"),
             max_relpath=float(max_relpath),
             tied_coins=tied_coins,
             selection_rule=rule,
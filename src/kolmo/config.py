@@ -27,6 +27,20 @@ class Settings(BaseSettings):
         default="https://api.freecurrencyapi.com",
         description="FreeCurrencyAPI base URL"
     )
+    provider_hedge_delay_ms: int = Field(
+        default=500,
+        ge=0,
+        description="Start the next provider if the current one has not answered within this delay (0 = race all)"
+    )
+    provider_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Max in-flight requests per provider (keeps backfills within upstream quotas)"
+    )
+    rates_cache_dir: str = Field(
+        default="",
+        description="Directory for on-disk cache of final (3+ days old) rates; empty disables"
+    )
     
     # === Database Configuration ===
     database_host: str = Field(default="localhost")
@@ -57,6 +71,8 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0")
     api_port: int = Field(default=8000)
     api_secret_key: str = Field(default="")
+    uvicorn_workers: int = Field(default=1, ge=1, description="Uvicorn worker processes")
+    thread_pool_size: int = Field(default=100, ge=1, description="anyio worker thread limit")
     
     # === Scheduler Configuration ===
     scheduler_cron_hour: int = Field(default=22, description="Daily job hour (EST)")
@@ -65,10 +81,21 @@ class Settings(BaseSettings):
     
     # === Logging ===
     log_level: str = Field(default="INFO")
+    log_format: str = Field(default="text", description="text or json")
     sentry_dsn: str = Field(default="")
     
     # === Feature Flags ===
     enable_backfill: bool = Field(default=False)
+    backfill_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Max pipelines run in parallel by /api/v1/trigger/range"
+    )
+    backfill_max_days: int = Field(
+        default=366,
+        ge=1,
+        description="Largest date span (inclusive) accepted by /api/v1/trigger/range"
+    )
     
     # === JSON Export Configuration ===
     json_export_enabled: bool = Field(
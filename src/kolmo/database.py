@@ -7,6 +7,7 @@ KOLMO Database Connection
 
 import logging
 from contextlib import asynccontextmanager
+from datetime import date
 from typing import AsyncGenerator
 
 import asyncpg
@@ -20,26 +21,50 @@ logger = logging.getLogger(__name__)
 _pool: Pool | None = None
 
 
+async def _init_connection(conn: Connection) -> None:
+    """
+    Pool init hook: prepare hot statements once per physical connection.
+    
+    Failures are logged only - a missing table must not block pool creation.
+    """
+    # Local import: kolmo.export depends on this module
+    from kolmo.export.json_exporter import warm_export_statements
+    
+    try:
+        await warm_export_statements(conn)
+    except Exception as e:
+        logger.debug("Export statement warm-up skipped: %s", e)
+
+
+def _connect_kwargs() -> dict:
+    """Connection parameters shared by the pool and dedicated connections."""
+    settings = get_settings()
+    return {
+        "host": settings.database_host,
+        "port": settings.database_port,
+        "database": settings.database_name,
+        "user": settings.database_user,
+        "password": settings.database_password,
+        # 🔒 REQ-7.5: SSL configuration
+        "ssl": "prefer" if settings.database_ssl_mode == "prefer" else settings.database_ssl_mode,
+    }
+
+
 async def create_pool() -> Pool:
     """Create database connection pool."""
     settings = get_settings()
     
     pool = await asyncpg.create_pool(
-        host=settings.database_host,
-        port=settings.database_port,
-        database=settings.database_name,
-        user=settings.database_user,
-        password=settings.database_password,
+        **_connect_kwargs(),
         min_size=2,
         max_size=10,
         command_timeout=30,
-        # 🔒 REQ-7.5: SSL configuration
-        ssl="prefer" if settings.database_ssl_mode == "prefer" else settings.database_ssl_mode,
+        init=_init_connection,
     )
     
     logger.info(
-        f"Database pool created: {settings.database_host}:{settings.database_port}"
-        f"/{settings.database_name}"
+        "Database pool created: %s:%s/%s",
+        settings.database_host, settings.database_port, settings.database_name
     )
     return pool
 
@@ -61,6 +86,58 @@ async def close_pool() -> None:
         logger.info("Database pool closed")
 
 
+async def try_advisory_lock(key: int) -> Connection | None:
+    """
+    Try to take a session-level advisory lock on a dedicated connection.
+    
+    Returns the connection holding the lock (close it to release), or None
+    if another session already holds it. Used for leader election across
+    uvicorn workers.
+    """
+    conn = await asyncpg.connect(**_connect_kwargs())
+    try:
+        if await conn.fetchval("SELECT pg_try_advisory_lock($1)", key):
+            return conn
+    except Exception:
+        await conn.close()
+        raise
+    await conn.close()
+    return None
+
+
+class AdvisoryLock:
+    """
+    Session-level advisory lock kept on a dedicated connection.
+    
+    The lock lives exactly as long as that connection: if it drops, the
+    server releases the lock and another process may take it. Callers
+    therefore re-check with ensure() right before doing leader-only work.
+    """
+    
+    def __init__(self, key: int):
+        self.key = key
+        self._conn: Connection | None = None
+    
+    async def ensure(self) -> bool:
+        """Return True if this process holds the lock, taking it if it is free."""
+        if self._conn is not None:
+            try:
+                await self._conn.fetchval("SELECT 1", timeout=5)
+                return True
+            except Exception as e:
+                logger.warning("⚠️ Advisory lock %s connection lost: %s", self.key, e)
+                self._conn.terminate()
+                self._conn = None
+        self._conn = await try_advisory_lock(self.key)
+        return self._conn is not None
+    
+    async def release(self) -> None:
+        """Release the lock by closing its connection."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+
 @asynccontextmanager
 async def get_connection() -> AsyncGenerator[Connection, None]:
     """Get database connection from pool."""
@@ -76,7 +153,7 @@ async def check_connection() -> bool:
             result = await conn.fetchval("SELECT 1")
             return result == 1
     except Exception as e:
-        logger.error(f"Database connection check failed: {e}")
+        logger.error("Database connection check failed: %s", e)
         return False
 
 
@@ -89,5 +166,34 @@ async def get_latest_data_date() -> str | None:
             )
             return str(result) if result else None
     except Exception as e:
-        logger.error(f"Failed to get latest data date: {e}")
+        logger.error("Failed to get latest data date: %s", e)
         return None
+
+
+async def fetch_compute_by_date(target_date: date) -> asyncpg.Record | None:
+    """Get the stored pipeline result for a date, if it was already computed."""
+    async with get_connection() as conn:
+        return await conn.fetchrow(
+            """
+            SELECT date, winner, kolmo_value, kolmo_state
+            FROM mcol1_compute_data
+            WHERE date = $1
+            """,
+            target_date
+        )
+
+
+async def fetch_compute_range(start: date, end: date) -> dict[date, asyncpg.Record]:
+    """Get stored pipeline results (with distances) for every computed date in [start, end]."""
+    async with get_connection() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT date, winner, kolmo_value, kolmo_state,
+                   dist_me4u, dist_iou2, dist_uome
+            FROM mcol1_compute_data
+            WHERE date BETWEEN $1 AND $2
+            """,
+            start,
+            end
+        )
+    return {row["date"]: row for row in rows}
@@ -6,6 +6,7 @@ KOLMO Export Module
 
 from kolmo.export.json_exporter import (
     JSONExporter,
+    export_all,
     export_daily_json,
     export_full_history_auto,
     FIXED_HISTORY_FILENAME,
@@ -13,6 +14,7 @@ from kolmo.export.json_exporter import (
 
 __all__ = [
     "JSONExporter",
+    "export_all",
     "export_daily_json",
     "export_full_history_auto",
     "FIXED_HISTORY_FILENAME",
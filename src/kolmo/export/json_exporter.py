@@ -10,10 +10,13 @@ Exports the following fields:
 - winner, kolmo_deviation
 """
 
+import csv
+import io
 import json
 import logging
+import os
 from datetime import date as date_type
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +30,8 @@ logger = logging.getLogger(__name__)
 class DecimalEncoder(json.JSONEncoder):
     """JSON encoder that handles Decimal types."""
     
+    __slots__ = ()
+    
     def default(self, obj: Any) -> Any:
         if isinstance(obj, Decimal):
             # Convert to string to preserve precision
@@ -36,6 +41,92 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Shared encoder instance - json.dump(cls=...) would build a new one per call
+_ENCODER = DecimalEncoder(indent=2, ensure_ascii=False)
+
+
+# =============================================================================
+# SQL for the hot export queries
+# =============================================================================
+# asyncpg keeps a per-connection prepared statement cache keyed by query text;
+# keeping the text in constants guarantees cache hits, and
+# warm_export_statements() fills the cache when the pool opens a connection.
+
+# kolmo_deviation is scaled and formatted in SQL: "<value × 1e5>e-5", 18 decimals
+_EXPORT_COLUMNS = """
+    date, r_me4u, r_iou2, r_uome,
+    relpath_me4u, relpath_iou2, relpath_uome,
+    vol_me4u, vol_iou2, vol_uome,
+    winner,
+    to_char(kolmo_deviation * 1e5, 'FM999999990.000000000000000000') || 'e-5' AS kolmo_deviation
+"""
+
+# kolmo_deviation is NUMERIC(28, 18); 18 decimals also after the 1e5 scaling
+_DEVIATION_QUANTUM = Decimal("1e-18")
+
+
+def _format_deviation(value: Decimal) -> str:
+    """
+    Format kolmo_deviation like the SQL above, for rows not read from the DB.
+    
+    Rounds to the column scale first (PostgreSQL rounds half away from zero),
+    so the daily file matches kolmo_history.json for the same date.
+    """
+    stored = value.quantize(_DEVIATION_QUANTUM, rounding=ROUND_HALF_UP)
+    if stored.is_zero():
+        stored = stored.copy_abs()
+    return f"{stored.scaleb(5).quantize(_DEVIATION_QUANTUM):f}e-5"
+
+
+_DATE_EXPORT_SQL = f"""
+    SELECT {_EXPORT_COLUMNS}
+    FROM mcol1_compute_data
+    WHERE date = $1
+"""
+
+_RANGE_EXPORT_SQL = f"""
+    SELECT {_EXPORT_COLUMNS}
+    FROM mcol1_compute_data
+    WHERE date BETWEEN $1 AND $2
+    ORDER BY date ASC
+"""
+
+# Column order for the COPY-based full history export (see _history_row_from_csv)
+_HISTORY_COPY_SQL = f"""
+    SELECT {_EXPORT_COLUMNS}
+    FROM mcol1_compute_data
+    ORDER BY date ASC
+"""
+
+_VOLATILITY_SQL = """
+    SELECT date, r_me4u, r_iou2, r_uome
+    FROM mcol1_compute_data
+    WHERE date <= $1
+    ORDER BY date DESC
+    LIMIT 2
+"""
+
+_FINGERPRINT_SQL = """
+    SELECT MAX(date) AS d, COUNT(*) AS c, MAX(updated_at) AS u
+    FROM mcol1_compute_data
+"""
+
+
+async def warm_export_statements(conn) -> None:
+    """
+    Prepare the hot export queries on a fresh pool connection.
+    
+    Runs each statement once with an empty date range so asyncpg caches
+    the prepared statement; later calls skip parse/plan round-trips.
+    COPY cannot be prepared, so the full-history export only benefits
+    through the fingerprint query.
+    """
+    await conn.fetch(_DATE_EXPORT_SQL, date_type.min)
+    await conn.fetch(_RANGE_EXPORT_SQL, date_type.max, date_type.min)
+    await conn.fetch(_VOLATILITY_SQL, date_type.min)
+    await conn.fetchrow(_FINGERPRINT_SQL)
+
+
 class JSONExporter:
     """
     Exports KOLMO metrics to JSON files for external analytics.
@@ -68,7 +159,7 @@ class JSONExporter:
             output_dir = Path("./data/export")
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"JSON Exporter initialized. Output dir: {self.output_dir}")
+        logger.info("JSON Exporter initialized. Output dir: %s", self.output_dir)
     
     def export_from_compute_data(
         self,
@@ -98,7 +189,7 @@ class JSONExporter:
             "vol_iou2": None,
             "vol_uome": None,
             "winner": compute_data.winner.value,
-            "kolmo_deviation": f"{float(compute_data.kolmo_deviation) * 1e5:.18f}e-5"
+            "kolmo_deviation": _format_deviation(compute_data.kolmo_deviation)
         }
         
         # Add volatility if provided
@@ -113,9 +204,9 @@ class JSONExporter:
         
         # Write JSON file
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, cls=DecimalEncoder, indent=2, ensure_ascii=False)
+            f.write(_ENCODER.encode(export_data))
         
-        logger.info(f"✅ Exported JSON: {filepath}")
+        logger.info("✅ Exported JSON: %s", filepath)
         return filepath
     
     def export_historical(
@@ -136,7 +227,7 @@ class JSONExporter:
         filename = f"kolmo_history_{start_date.isoformat()}_{end_date.isoformat()}.json"
         filepath = self.output_dir / filename
         
-        logger.info(f"Exporting historical data: {start_date} to {end_date}")
+        logger.info("Exporting historical data: %s to %s", start_date, end_date)
         return filepath
 
 
@@ -172,41 +263,36 @@ async def _get_volatility_for_date(target_date: date_type) -> dict[str, Decimal
     """
     try:
         async with get_connection() as conn:
-            # Get current and previous day rates
-            rows = await conn.fetch(
-                """
-                SELECT date, r_me4u, r_iou2, r_uome
-                FROM mcol1_compute_data
-                WHERE date <= $1
-                ORDER BY date DESC
-                LIMIT 2
-                """,
-                target_date
-            )
-            
-            if len(rows) < 2:
-                # First day - no previous data for volatility
-                return {"vol_me4u": None, "vol_iou2": None, "vol_uome": None}
-            
-            current = rows[0]
-            previous = rows[1]
-            
-            # Calculate volatility: (today - yesterday) / yesterday * 100
-            vol_me4u = (Decimal(str(current["r_me4u"])) - Decimal(str(previous["r_me4u"]))) / Decimal(str(previous["r_me4u"])) * 100
-            vol_iou2 = (Decimal(str(current["r_iou2"])) - Decimal(str(previous["r_iou2"]))) / Decimal(str(previous["r_iou2"])) * 100
-            vol_uome = (Decimal(str(current["r_uome"])) - Decimal(str(previous["r_uome"]))) / Decimal(str(previous["r_uome"])) * 100
-            
-            return {
-                "vol_me4u": vol_me4u,
-                "vol_iou2": vol_iou2,
-                "vol_uome": vol_uome
-            }
-            
+            return await _fetch_volatility(conn, target_date)
     except Exception as e:
-        logger.warning(f"Could not compute volatility: {e}")
+        logger.warning("Could not compute volatility: %s", e)
         return {"vol_me4u": None, "vol_iou2": None, "vol_uome": None}
 
 
+async def _fetch_volatility(conn, target_date: date_type) -> dict[str, Decimal | None]:
+    """Volatility query on an already acquired connection."""
+    # Get current and previous day rates
+    rows = await conn.fetch(_VOLATILITY_SQL, target_date)
+    
+    if len(rows) < 2:
+        # First day - no previous data for volatility
+        return {"vol_me4u": None, "vol_iou2": None, "vol_uome": None}
+    
+    current = rows[0]
+    previous = rows[1]
+    
+    # Calculate volatility: (today - yesterday) / yesterday * 100
+    vol_me4u = (Decimal(str(current["r_me4u"])) - Decimal(str(previous["r_me4u"]))) / Decimal(str(previous["r_me4u"])) * 100
+    vol_iou2 = (Decimal(str(current["r_iou2"])) - Decimal(str(previous["r_iou2"]))) / Decimal(str(previous["r_iou2"])) * 100
+    vol_uome = (Decimal(str(current["r_uome"])) - Decimal(str(previous["r_uome"]))) / Decimal(str(previous["r_uome"])) * 100
+    
+    return {
+        "vol_me4u": vol_me4u,
+        "vol_iou2": vol_iou2,
+        "vol_uome": vol_uome
+    }
+
+
 async def export_from_database(
     target_date: date_type,
     output_dir: str | Path | None = None
@@ -225,21 +311,10 @@ async def export_from_database(
     
     try:
         async with get_connection() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT 
-                    date, r_me4u, r_iou2, r_uome,
-                    relpath_me4u, relpath_iou2, relpath_uome,
-                    vol_me4u, vol_iou2, vol_uome,
-                    winner, kolmo_deviation
-                FROM mcol1_compute_data
-                WHERE date = $1
-                """,
-                target_date
-            )
+            row = await conn.fetchrow(_DATE_EXPORT_SQL, target_date)
             
             if not row:
-                logger.warning(f"No data found for date: {target_date}")
+                logger.warning("No data found for date: %s", target_date)
                 return None
             
             export_data = {
@@ -254,20 +329,20 @@ async def export_from_database(
                 "vol_iou2": float(row["vol_iou2"]) if row["vol_iou2"] is not None else None,
                 "vol_uome": float(row["vol_uome"]) if row["vol_uome"] is not None else None,
                 "winner": row["winner"],
-                "kolmo_deviation": f"{float(row['kolmo_deviation']) * 1e5:.18f}e-5"
+                "kolmo_deviation": row["kolmo_deviation"]
             }
             
             filename = f"kolmo_{target_date.isoformat()}.json"
             filepath = exporter.output_dir / filename
             
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+                f.write(_ENCODER.encode(export_data))
             
-            logger.info(f"✅ Exported from DB: {filepath}")
+            logger.info("✅ Exported from DB: %s", filepath)
             return filepath
             
     except Exception as e:
-        logger.error(f"Failed to export from database: {e}")
+        logger.error("Failed to export from database: %s", e)
         return None
 
 
@@ -291,22 +366,10 @@ async def export_history_to_json(
     
     try:
         async with get_connection() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT 
-                    date, r_me4u, r_iou2, r_uome,
-                    relpath_me4u, relpath_iou2, relpath_uome,
-                    vol_me4u, vol_iou2, vol_uome,
-                    winner, kolmo_deviation
-                FROM mcol1_compute_data
-                WHERE date BETWEEN $1 AND $2
-                ORDER BY date ASC
-                """,
-                start_date, end_date
-            )
+            rows = await conn.fetch(_RANGE_EXPORT_SQL, start_date, end_date)
             
             if not rows:
-                logger.warning(f"No data found for range: {start_date} to {end_date}")
+                logger.warning("No data found for range: %s to %s", start_date, end_date)
                 return None
             
             export_data = []
@@ -323,20 +386,20 @@ async def export_history_to_json(
                     "vol_iou2": float(row["vol_iou2"]) if row["vol_iou2"] is not None else None,
                     "vol_uome": float(row["vol_uome"]) if row["vol_uome"] is not None else None,
                     "winner": row["winner"],
-                    "kolmo_deviation": f"{float(row['kolmo_deviation']) * 1e5:.18f}e-5"
+                    "kolmo_deviation": row["kolmo_deviation"]
                 })
             
             filename = f"kolmo_history_{start_date.isoformat()}_{end_date.isoformat()}.json"
             filepath = exporter.output_dir / filename
             
             with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, cls=DecimalEncoder, indent=2, ensure_ascii=False)
+                f.write(_ENCODER.encode(export_data))
             
-            logger.info(f"✅ Exported history ({len(export_data)} records): {filepath}")
+            logger.info("✅ Exported history (%s records): %s", len(export_data), filepath)
             return filepath
             
     except Exception as e:
-        logger.error(f"Failed to export history: {e}")
+        logger.error("Failed to export history: %s", e)
         return None
 
 
@@ -347,6 +410,61 @@ async def export_history_to_json(
 FIXED_HISTORY_FILENAME = "kolmo_history.json"
 
 
+async def _history_fingerprint(conn) -> str:
+    """
+    Cheap fingerprint of mcol1_compute_data for change detection.
+
+    Combines the latest date, row count and latest update time, so both
+    appended days and in-place corrections (ON CONFLICT ... DO UPDATE)
+    produce a new value.
+    """
+    row = await conn.fetchrow(_FINGERPRINT_SQL)
+    return f"{row['d']}-{row['c']}-{row['u']}"
+
+
+def _float_or_none(value: str) -> float | None:
+    """CSV NULL is an empty unquoted field."""
+    return float(value) if value else None
+
+
+def _history_row_from_csv(fields: list[str]) -> dict[str, Any]:
+    """
+    Build one kolmo_history.json record from a COPY ... (FORMAT csv) line.
+    
+    NUMERIC columns arrive as their canonical text (scale preserved), so the
+    rates are passed through unchanged - same output as str(Decimal).
+    kolmo_deviation is already formatted by the query.
+    """
+    (
+        date_str, r_me4u, r_iou2, r_uome,
+        relpath_me4u, relpath_iou2, relpath_uome,
+        vol_me4u, vol_iou2, vol_uome,
+        winner, kolmo_deviation,
+    ) = fields
+    return {
+        "date": date_str,
+        "r_me4u": r_me4u,
+        "r_iou2": r_iou2,
+        "r_uome": r_uome,
+        "relpath_me4u": _float_or_none(relpath_me4u),
+        "relpath_iou2": _float_or_none(relpath_iou2),
+        "relpath_uome": _float_or_none(relpath_uome),
+        "vol_me4u": _float_or_none(vol_me4u),
+        "vol_iou2": _float_or_none(vol_iou2),
+        "vol_uome": _float_or_none(vol_uome),
+        "winner": winner,
+        "kolmo_deviation": kolmo_deviation
+    }
+
+
+def _write_atomic(filepath: Path, content: str) -> None:
+    """Write text to filepath via a temporary file and atomic rename."""
+    tmp_path = filepath.with_name(filepath.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, filepath)
+
+
 async def export_full_history_auto(
     output_dir: str | Path | None = None
 ) -> Path | None:
@@ -355,8 +473,9 @@ async def export_full_history_auto(
     
     This function:
     - Queries ALL data from mcol1_compute_data
-    - ALWAYS writes to: kolmo_history_2021-07-01_2026-01-22.json
-    - Overwrites the file on each call
+    - ALWAYS writes to: kolmo_history.json
+    - Overwrites the file only when the table changed since the last export
+      (tracked by a sidecar kolmo_history.etag fingerprint)
     
     Use this after backfill or daily updates to keep the export current.
     
@@ -370,48 +489,86 @@ async def export_full_history_auto(
     
     try:
         async with get_connection() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT 
-                    date, r_me4u, r_iou2, r_uome,
-                    relpath_me4u, relpath_iou2, relpath_uome,
-                    vol_me4u, vol_iou2, vol_uome,
-                    winner, kolmo_deviation
-                FROM mcol1_compute_data
-                ORDER BY date ASC
-                """
-            )
-            
-            if not rows:
-                logger.warning("No data found in mcol1_compute_data")
-                return None
-            
-            export_data = []
-            for row in rows:
-                export_data.append({
-                    "date": row["date"].isoformat(),
-                    "r_me4u": str(row["r_me4u"]),
-                    "r_iou2": str(row["r_iou2"]),
-                    "r_uome": str(row["r_uome"]),
-                    "relpath_me4u": float(row["relpath_me4u"]) if row["relpath_me4u"] is not None else None,
-                    "relpath_iou2": float(row["relpath_iou2"]) if row["relpath_iou2"] is not None else None,
-                    "relpath_uome": float(row["relpath_uome"]) if row["relpath_uome"] is not None else None,
-                    "vol_me4u": float(row["vol_me4u"]) if row["vol_me4u"] is not None else None,
-                    "vol_iou2": float(row["vol_iou2"]) if row["vol_iou2"] is not None else None,
-                    "vol_uome": float(row["vol_uome"]) if row["vol_uome"] is not None else None,
-                    "winner": row["winner"],
-                    "kolmo_deviation": f"{float(row['kolmo_deviation']) * 1e5:.18f}e-5"
-                })
-            
-            # FIXED filename - always the same
-            filepath = exporter.output_dir / FIXED_HISTORY_FILENAME
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, cls=DecimalEncoder, indent=2, ensure_ascii=False)
-            
-            logger.info(f"✅ Auto-exported history ({len(export_data)} records): {filepath}")
-            return filepath
-            
+            return await _export_full_history(conn, exporter)
     except Exception as e:
-        logger.error(f"Failed to auto-export history: {e}")
+        logger.error("Failed to auto-export history: %s", e)
         return None
+
+
+async def _export_full_history(conn, exporter: JSONExporter) -> Path | None:
+    """Full history export on an already acquired connection."""
+    # FIXED filename - always the same
+    filepath = exporter.output_dir / FIXED_HISTORY_FILENAME
+    etag_path = filepath.with_suffix(".etag")
+    
+    fingerprint = await _history_fingerprint(conn)
+    
+    # Nothing changed since the last export - keep the existing file
+    if filepath.exists() and etag_path.exists():
+        if etag_path.read_text(encoding="utf-8").strip() == fingerprint:
+            logger.info("History unchanged (%s), skipping export: %s", fingerprint, filepath)
+            return filepath
+    
+    # COPY streams raw CSV bytes and skips per-row Record construction
+    chunks: list[bytes] = []
+    
+    async def _sink(chunk: bytes) -> None:
+        chunks.append(chunk)
+    
+    await conn.copy_from_query(_HISTORY_COPY_SQL, output=_sink, format="csv")
+    
+    reader = csv.reader(io.StringIO(b"".join(chunks).decode("utf-8")))
+    export_data = [_history_row_from_csv(fields) for fields in reader]
+    
+    if not export_data:
+        logger.warning("No data found in mcol1_compute_data")
+        return None
+    
+    _write_atomic(filepath, _ENCODER.encode(export_data))
+    _write_atomic(etag_path, fingerprint)
+    
+    logger.info("✅ Auto-exported history (%s records): %s", len(export_data), filepath)
+    return filepath
+
+
+async def export_all(
+    compute_data: ComputeDataCreate,
+    output_dir: str | Path | None = None
+) -> tuple[Path, Path | None]:
+    """
+    🔒 REQ-6.1: Daily JSON + kolmo_history.json in one pass.
+    
+    Both exports run on a single pooled connection inside one read-only
+    REPEATABLE READ transaction, so the history file is built from the
+    same snapshot as the daily volatility (including today's row). Each
+    step runs in its own savepoint, so a failed query does not abort the
+    transaction for the steps after it.
+    
+    Args:
+        compute_data: Computed KOLMO metrics (already persisted)
+        output_dir: Optional custom output directory
+    
+    Returns:
+        Tuple of (daily_json_path, history_json_path or None on error)
+    """
+    exporter = JSONExporter(output_dir)
+    
+    async with get_connection() as conn:
+        async with conn.transaction(isolation="repeatable_read", readonly=True):
+            try:
+                async with conn.transaction():
+                    volatility = await _fetch_volatility(conn, compute_data.date)
+            except Exception as e:
+                logger.warning("Could not compute volatility: %s", e)
+                volatility = {"vol_me4u": None, "vol_iou2": None, "vol_uome": None}
+            
+            daily_path = exporter.export_from_compute_data(compute_data, volatility)
+            
+            try:
+                async with conn.transaction():
+                    history_path = await _export_full_history(conn, exporter)
+            except Exception as e:
+                logger.error("Failed to auto-export history: %s", e)
+                history_path = None
+    
+    return daily_path, history_path
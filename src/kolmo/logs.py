@@ -0,0 +1,34 @@
+"""
+KOLMO Log Formatting
+
+JSON log lines for log shippers, enabled with LOG_FORMAT=json.
+"""
+
+import logging
+from datetime import datetime, timezone
+
+import orjson
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Render each record as one compact JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def configure_log_format(log_format: str) -> None:
+    """Switch root handlers to JSON output when requested."""
+    if log_format.lower() != "json":
+        return
+    formatter = JSONLogFormatter()
+    for handler in logging.getLogger().handlers:
+        handler.setFormatter(formatter)
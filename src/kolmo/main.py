@@ -6,27 +6,44 @@ KOLMO.wiazor.com Main Application Entry Point
 """
 
 import asyncio
+import json
 import logging
 import sys
-from contextlib import asynccontextmanager
-from datetime import date, datetime
-from typing import Any
-from uuid import uuid4
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, AsyncIterator
+from uuid import UUID
 
+import anyio.to_thread
 import uvicorn
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from kolmo import __version__
-from kolmo.api import router
+from kolmo.api import KolmoJSONResponse, router
+from kolmo.cache import invalidate as invalidate_rates
 from kolmo.computation import ComputationEngine
-from kolmo.computation.engine import persist_compute_data, persist_external_data
+from kolmo.computation.engine import (
+    persist_compute_data,
+    persist_compute_data_batch,
+    persist_external_data,
+    persist_external_data_batch,
+)
 from kolmo.config import get_settings
-from kolmo.export import export_daily_json
-from kolmo.database import close_pool, get_pool
-from kolmo.models import CurrencyPair, ExternalDataCreate
+from kolmo.export import export_all
+from kolmo.logs import configure_log_format
+from kolmo.database import (
+    AdvisoryLock,
+    close_pool,
+    fetch_compute_by_date,
+    fetch_compute_range,
+    get_pool,
+)
+from kolmo.models import ComputeDataCreate, CurrencyPair, ExternalDataCreate, next_uuid4
 from kolmo.providers import ProviderManager
 
 # Configure logging
@@ -40,8 +57,70 @@ logger = logging.getLogger(__name__)
 # Global scheduler
 scheduler: AsyncIOScheduler | None = None
 
+# Advisory lock key electing the one worker that runs the daily job ("KOLMO")
+SCHEDULER_LOCK_KEY = 0x4B4F4C4D4F
+
+# Computed rows stored per COPY during a range backfill; results stream per batch
+RANGE_PERSIST_BATCH = 100
 
-async def run_daily_pipeline(target_date: date | None = None) -> dict[str, Any]:
+# mcol1_compute_data.dist_* are NUMERIC(10,4)
+_DIST_QUANTUM = Decimal("0.0001")
+
+
+def _build_external_data(
+    target_date: date,
+    rates: dict[str, Decimal],
+    provider_used: str,
+    trace_id: UUID
+) -> ExternalDataCreate:
+    """
+    Wrap provider rates in the raw-data model persisted by Stage 2.
+    
+    Providers already return Decimal (REQ-2.1), so validation is skipped;
+    full validation stays at the HTTP boundary where input is untrusted.
+    """
+    return ExternalDataCreate.model_construct(
+        date=target_date,
+        eur_usd=rates["eur_usd"],
+        eur_usd_pair_desc=CurrencyPair.EUR_USD,
+        eur_cny=rates["eur_cny"],
+        eur_cny_pair_desc=CurrencyPair.EUR_CNY,
+        eur_rub=rates.get("eur_rub"),
+        eur_rub_pair_desc=CurrencyPair.EUR_RUB if rates.get("eur_rub") else None,
+        eur_inr=rates.get("eur_inr"),
+        eur_inr_pair_desc=CurrencyPair.EUR_INR if rates.get("eur_inr") else None,
+        eur_aed=rates.get("eur_aed"),
+        eur_aed_pair_desc=CurrencyPair.EUR_AED if rates.get("eur_aed") else None,
+        trace_id=trace_id,
+        sources={
+            "provider": provider_used,
+            "fetch_time": datetime.utcnow().isoformat()
+        }
+    )
+
+
+def _cached_result(target_date: date, row) -> dict[str, Any]:
+    """Pipeline result for a date that was already computed."""
+    return {
+        "success": True,
+        "cached": True,
+        "date": target_date.isoformat(),
+        "winner": row["winner"],
+        "kolmo_value": str(row["kolmo_value"]),
+        "kolmo_state": row["kolmo_state"],
+    }
+
+
+def _stored_distance(value: Decimal) -> Decimal:
+    """Round a distance the way PostgreSQL stores it in NUMERIC(10,4)."""
+    return value.quantize(_DIST_QUANTUM, rounding=ROUND_HALF_UP)
+
+
+async def run_daily_pipeline(
+    target_date: date | None = None,
+    provider_manager: ProviderManager | None = None,
+    force: bool = False
+) -> dict[str, Any]:
     """
     🔒 REQ-3.1: Execute the four-stage KOLMO pipeline.
     
@@ -52,6 +131,9 @@ async def run_daily_pipeline(target_date: date | None = None) -> dict[str, Any]:
     
     Args:
         target_date: Date to fetch rates for. Defaults to today.
+        provider_manager: Shared manager (from app lifespan). If omitted, a
+            temporary one is created and closed when the run finishes.
+        force: Recompute even if the date already has compute data.
     
     Returns:
         Dictionary with pipeline execution results
@@ -60,43 +142,45 @@ async def run_daily_pipeline(target_date: date | None = None) -> dict[str, Any]:
         target_date = date.today()
     
     date_str = target_date.isoformat()
-    trace_id = uuid4()
+    trace_id = next_uuid4()
     
-    logger.info(f"🚀 Starting KOLMO pipeline for {date_str} (trace: {trace_id})")
+    logger.info("🚀 Starting KOLMO pipeline for %s (trace: %s)", date_str, trace_id)
+    
+    # Idempotency: a computed date is final unless a recompute is forced
+    if not force:
+        try:
+            existing = await fetch_compute_by_date(target_date)
+        except Exception as e:
+            existing = None
+            logger.warning("⚠️ Existing-data check failed, running pipeline: %s", e)
+        if existing is not None:
+            logger.info("✅ %s already computed, skipping (use force to recompute)", date_str)
+            return _cached_result(target_date, existing)
+    else:
+        # A forced recompute is a correction: refetch instead of reusing cached rates
+        await invalidate_rates(date_str)
+    
+    owns_manager = provider_manager is None
+    if owns_manager:
+        provider_manager = ProviderManager()
+    elif force:
+        provider_manager.invalidate(date_str)
     
     try:
         # === STAGE 1: DATA ACQUISITION ===
         logger.info("📥 Stage 1: Data Acquisition")
-        provider_manager = ProviderManager()
         
         rates, provider_used = await provider_manager.fetch_with_fallback(date_str)
         
-        logger.info(f"✅ Stage 1 complete: Data from {provider_used}")
+        logger.info("✅ Stage 1 complete: Data from %s", provider_used)
         
         # === STAGE 2: STORAGE ===
         logger.info("💾 Stage 2: Storage")
         
-        external_data = ExternalDataCreate(
-            date=target_date,
-            eur_usd=rates["eur_usd"],
-            eur_usd_pair_desc=CurrencyPair.EUR_USD,
-            eur_cny=rates["eur_cny"],
-            eur_cny_pair_desc=CurrencyPair.EUR_CNY,
-            eur_rub=rates.get("eur_rub"),
-            eur_rub_pair_desc=CurrencyPair.EUR_RUB if rates.get("eur_rub") else None,
-            eur_inr=rates.get("eur_inr"),
-            eur_inr_pair_desc=CurrencyPair.EUR_INR if rates.get("eur_inr") else None,
-            eur_aed=rates.get("eur_aed"),
-            eur_aed_pair_desc=CurrencyPair.EUR_AED if rates.get("eur_aed") else None,
-            trace_id=trace_id,
-            sources={
-                "provider": provider_used,
-                "fetch_time": datetime.utcnow().isoformat()
-            }
-        )
+        external_data = _build_external_data(target_date, rates, provider_used, trace_id)
         
         await persist_external_data(external_data)
-        logger.info(f"✅ Stage 2 complete: Raw data persisted (snapshot: {external_data.mcol1_snapshot_id})")
+        logger.info("✅ Stage 2 complete: Raw data persisted (snapshot: %s)", external_data.mcol1_snapshot_id)
         
         # === STAGE 3: COMPUTATION ===
         logger.info("🧮 Stage 3: Computation")
@@ -106,27 +190,28 @@ async def run_daily_pipeline(target_date: date | None = None) -> dict[str, Any]:
         
         await persist_compute_data(compute_data)
         logger.info(
-            f"✅ Stage 3 complete: Winner={compute_data.winner.value}, "
-            f"KOLMO={compute_data.kolmo_value}"
+            "✅ Stage 3 complete: Winner=%s, KOLMO=%s",
+            compute_data.winner.value, compute_data.kolmo_value
         )
         
         # === STAGE 3.5: JSON EXPORT ===
         settings = get_settings()
         json_path = None
+        history_path = None
         if settings.json_export_enabled:
             logger.info("📄 Stage 3.5: JSON Export")
             try:
-                json_path = await export_daily_json(
+                json_path, history_path = await export_all(
                     compute_data,
                     output_dir=settings.json_export_dir
                 )
-                logger.info(f"✅ JSON exported: {json_path}")
+                logger.info("✅ JSON exported: %s, history: %s", json_path, history_path)
             except Exception as e:
-                logger.warning(f"⚠️ JSON export failed (non-blocking): {e}")
+                logger.warning("⚠️ JSON export failed (non-blocking): %s", e)
         
         # === STAGE 4: API SERVING ===
         logger.info("🌐 Stage 4: API Ready")
-        logger.info(f"✅ Pipeline complete for {date_str}")
+        logger.info("✅ Pipeline complete for %s", date_str)
         
         return {
             "success": True,
@@ -136,27 +221,222 @@ async def run_daily_pipeline(target_date: date | None = None) -> dict[str, Any]:
             "kolmo_value": str(compute_data.kolmo_value),
             "kolmo_state": compute_data.kolmo_state.value,
             "trace_id": str(trace_id),
-            "json_export": str(json_path) if json_path else None
+            "json_export": str(json_path) if json_path else None,
+            "json_history_export": str(history_path) if history_path else None
         }
         
     except Exception as e:
-        logger.error(f"❌ Pipeline failed for {date_str}: {e}")
+        logger.error("❌ Pipeline failed for %s: %s", date_str, e)
         return {
             "success": False,
             "date": date_str,
             "error": str(e),
             "trace_id": str(trace_id)
         }
+    
+    finally:
+        if owns_manager:
+            await provider_manager.aclose()
+
+
+async def run_range_pipeline(
+    dates: list[date],
+    provider_manager: ProviderManager,
+    force: bool = False
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    🔒 REQ-1.7: Backfill pipeline for many dates.
+    
+    Dates that are already computed are skipped unless `force` is set, as in
+    run_daily_pipeline. Stage 1 runs concurrently (bounded by
+    BACKFILL_CONCURRENCY). All raw data is then persisted via COPY before any
+    computation starts (REQ-3.2). Stage 3 runs in date order, because
+    RelativePath depends on the previous day's distances, which are chained
+    in memory at the stored NUMERIC(10,4) precision instead of re-queried.
+    
+    Computed rows are persisted every RANGE_PERSIST_BATCH dates; results are
+    yielded only once their rows are stored, and a storage error is reported
+    as a failure for each affected date.
+    
+    Yields:
+        One result dict per date, in date order
+    """
+    settings = get_settings()
+    sem = asyncio.Semaphore(settings.backfill_concurrency)
+    
+    # Idempotency: computed dates are final unless a recompute is forced
+    existing: dict[date, Any] = {}
+    if force:
+        for d in dates:
+            date_str = d.isoformat()
+            await invalidate_rates(date_str)
+            provider_manager.invalidate(date_str)
+    elif dates:
+        try:
+            existing = await fetch_compute_range(dates[0], dates[-1])
+        except Exception as e:
+            logger.warning("⚠️ Existing-data check failed, running full range: %s", e)
+    
+    async def fetch(d: date):
+        async with sem:
+            return await provider_manager.fetch_with_fallback(d.isoformat())
+    
+    # === STAGE 1: DATA ACQUISITION (concurrent) ===
+    to_fetch = [d for d in dates if d not in existing]
+    outcomes = await asyncio.gather(*(fetch(d) for d in to_fetch), return_exceptions=True)
+    
+    fetched: list[tuple[ExternalDataCreate, str]] = []
+    failed: dict[date, str] = {}
+    for d, outcome in zip(to_fetch, outcomes):
+        if isinstance(outcome, BaseException):
+            failed[d] = str(outcome)
+        else:
+            rates, provider_used = outcome
+            fetched.append((_build_external_data(d, rates, provider_used, next_uuid4()), provider_used))
+    
+    # === STAGE 2: STORAGE (COPY) ===
+    try:
+        await persist_external_data_batch([ext for ext, _ in fetched])
+    except Exception as e:
+        logger.error("❌ Backfill storage failed: %s", e)
+        for d in dates:
+            if d in existing:
+                yield _cached_result(d, existing[d])
+            else:
+                yield {"success": False, "date": d.isoformat(), "error": failed.get(d, str(e))}
+        return
+    
+    # === STAGE 3: COMPUTATION (date order) ===
+    engine = ComputationEngine()
+    by_date = {ext.date: (ext, provider_used) for ext, provider_used in fetched}
+    pending: list[ComputeDataCreate] = []
+    pending_results: list[dict[str, Any]] = []
+    prev_distances: dict[str, Decimal | None] | None = None
+    last_compute: ComputeDataCreate | None = None
+    
+    async def flush() -> list[dict[str, Any]]:
+        """Persist buffered rows; return the results they now stand for."""
+        nonlocal prev_distances, last_compute
+        if not pending:
+            return []
+        try:
+            await persist_compute_data_batch(pending)
+            last_compute = pending[-1]
+            results = list(pending_results)
+        except Exception as e:
+            logger.error("❌ Backfill compute storage failed: %s", e)
+            results = [
+                {"success": False, "date": result["date"], "error": str(e)}
+                for result in pending_results
+            ]
+            # Unsaved distances must not seed the next date
+            prev_distances = None
+        pending.clear()
+        pending_results.clear()
+        return results
+    
+    for d in dates:
+        date_str = d.isoformat()
+        if d in existing:
+            for result in await flush():
+                yield result
+            row = existing[d]
+            prev_distances = {
+                "dist_me4u": row["dist_me4u"],
+                "dist_iou2": row["dist_iou2"],
+                "dist_uome": row["dist_uome"]
+            }
+            yield _cached_result(d, row)
+            continue
+        if d not in by_date:
+            # Gap: flush so the next date's DB lookup sees everything before it
+            for result in await flush():
+                yield result
+            prev_distances = None
+            yield {"success": False, "date": date_str, "error": failed[d]}
+            continue
+        
+        external_data, provider_used = by_date[d]
+        try:
+            compute_data = await engine.compute_daily_metrics(external_data, prev_distances)
+        except Exception as e:
+            for result in await flush():
+                yield result
+            prev_distances = None
+            yield {"success": False, "date": date_str, "error": str(e)}
+            continue
+        
+        pending.append(compute_data)
+        pending_results.append({
+            "success": True,
+            "date": date_str,
+            "provider": provider_used,
+            "winner": compute_data.winner.value,
+            "kolmo_value": str(compute_data.kolmo_value),
+            "kolmo_state": compute_data.kolmo_state.value,
+            "trace_id": str(external_data.trace_id)
+        })
+        # Chain at stored precision so relpaths match a single-date run,
+        # which reads the previous distances back from NUMERIC(10,4)
+        prev_distances = {
+            "dist_me4u": _stored_distance(compute_data.dist_me4u),
+            "dist_iou2": _stored_distance(compute_data.dist_iou2),
+            "dist_uome": _stored_distance(compute_data.dist_uome)
+        }
+        if len(pending) >= RANGE_PERSIST_BATCH:
+            for result in await flush():
+                yield result
+    
+    for result in await flush():
+        yield result
+    
+    # === STAGE 3.5: JSON EXPORT (once, for the newest computed date) ===
+    if last_compute is not None and settings.json_export_enabled:
+        try:
+            await export_all(last_compute, output_dir=settings.json_export_dir)
+        except Exception as e:
+            logger.warning("⚠️ JSON export failed (non-blocking): %s", e)
 
 
-async def scheduled_job():
-    """Scheduled daily job wrapper."""
+async def _holds_scheduler_lock(leader: AdvisoryLock) -> bool:
+    """Check (or take over) scheduler leadership; falls back to single-worker mode."""
+    try:
+        return await leader.ensure()
+    except Exception as e:
+        logger.warning("⚠️ Scheduler leader election unavailable: %s", e)
+        return get_settings().uvicorn_workers == 1
+
+
+async def scheduled_job(
+    provider_manager: ProviderManager | None = None,
+    leader: AdvisoryLock | None = None
+):
+    """
+    Scheduled daily job wrapper.
+    
+    Every worker schedules the job; leadership is re-checked at fire time so
+    a worker whose lock connection dropped stands down and a standby worker
+    takes over once the lock is free.
+    """
+    if leader is not None and not await _holds_scheduler_lock(leader):
+        logger.info("⏰ Scheduled job skipped: another worker holds the scheduler lock")
+        return
+    
     logger.info("⏰ Scheduled job triggered")
-    result = await run_daily_pipeline()
+    result = await run_daily_pipeline(provider_manager=provider_manager)
     if result["success"]:
-        logger.info(f"⏰ Scheduled job completed: Winner={result['winner']}")
+        logger.info("⏰ Scheduled job completed: Winner=%s", result['winner'])
     else:
-        logger.error(f"⏰ Scheduled job failed: {result.get('error')}")
+        logger.error("⏰ Scheduled job failed: %s", result.get('error'))
+
+
+async def _warm_up_providers(provider_manager: ProviderManager) -> None:
+    """Hit every provider's health endpoint once to prime its HTTP client."""
+    try:
+        statuses = await provider_manager.health_check_all()
+        logger.info("🔥 Provider warm-up: %s", statuses)
+    except Exception as e:
+        logger.warning("⚠️ Provider warm-up failed: %s", e)
 
 
 @asynccontextmanager
@@ -167,14 +447,31 @@ async def lifespan(app: FastAPI):
     settings = get_settings()
     
     # Startup
-    logger.info(f"🚀 Starting KOLMO v.{__version__}")
+    configure_log_format(settings.log_format)
+    logger.info("🚀 Starting KOLMO v.%s", __version__)
+    
+    # Handlers are async; the pool only serves blocking helpers, but bursty
+    # backfills must not queue behind anyio's default 40 slots
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
     
     # Initialize database pool
     try:
         await get_pool()
         logger.info("✅ Database connection pool initialized")
     except Exception as e:
-        logger.warning(f"⚠️ Database not available: {e}")
+        logger.warning("⚠️ Database not available: %s", e)
+    
+    # Provider clients live for the whole process (shared connection pools)
+    app.state.provider_manager = ProviderManager()
+    
+    # Resolve DNS and open TLS sessions now rather than on the first daily run;
+    # runs in the background so startup is not held up by a slow provider
+    warmup_task = asyncio.create_task(_warm_up_providers(app.state.provider_manager))
+    
+    # Only one worker process may run the daily job (leader election). Each
+    # worker keeps a scheduler; the lock is re-checked whenever the job fires
+    leader = AdvisoryLock(SCHEDULER_LOCK_KEY)
+    is_leader = await _holds_scheduler_lock(leader)
     
     # Initialize scheduler
     scheduler = AsyncIOScheduler(timezone=settings.scheduler_timezone)
@@ -186,6 +483,7 @@ async def lifespan(app: FastAPI):
             hour=settings.scheduler_cron_hour,
             minute=settings.scheduler_cron_minute
         ),
+        kwargs={"provider_manager": app.state.provider_manager, "leader": leader},
         id="daily_kolmo_pipeline",
         name="Daily KOLMO Pipeline",
         replace_existing=True
@@ -193,9 +491,9 @@ async def lifespan(app: FastAPI):
     
     scheduler.start()
     logger.info(
-        f"⏰ Scheduler started: Daily job at "
-        f"{settings.scheduler_cron_hour:02d}:{settings.scheduler_cron_minute:02d} "
-        f"{settings.scheduler_timezone}"
+        "⏰ Scheduler started: Daily job at %02d:%02d %s (%s)",
+        settings.scheduler_cron_hour, settings.scheduler_cron_minute, settings.scheduler_timezone,
+        "leader" if is_leader else "standby"
     )
     
     yield
@@ -207,6 +505,14 @@ async def lifespan(app: FastAPI):
         scheduler.shutdown()
         logger.info("⏰ Scheduler stopped")
     
+    await leader.release()
+    
+    # Let an in-flight health check unwind before its clients are closed
+    warmup_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await warmup_task
+    
+    await app.state.provider_manager.aclose()
     await close_pool()
     logger.info("✅ Shutdown complete")
 
@@ -218,6 +524,7 @@ def create_app() -> FastAPI:
         description="DTKT Currency Triangle Monitoring System",
         version=__version__,
         lifespan=lifespan,
+        default_response_class=KolmoJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/api/v1/openapi.json"
@@ -235,22 +542,70 @@ def create_app() -> FastAPI:
     # Include API routes
     app.include_router(router)
     
+    # Range backfill (registered before /trigger/{date_str} so "range" is not a date)
+    @app.post("/api/v1/trigger/range")
+    async def trigger_range(request: Request, start: str, end: str, force: bool = False):
+        """
+        🔒 REQ-1.7: Backfill every date in [start, end].
+        
+        Provider fetches run concurrently (capped by BACKFILL_CONCURRENCY);
+        persistence is batched via COPY. Progress is streamed as server-sent
+        events, one per date, followed by a final summary event. Spans longer
+        than BACKFILL_MAX_DAYS are rejected; computed dates are skipped
+        unless `force` is set.
+        """
+        settings = get_settings()
+        if not settings.enable_backfill:
+            return {"error": "Backfill is disabled. Set ENABLE_BACKFILL=true."}
+        try:
+            start_date = date.fromisoformat(start)
+            end_date = date.fromisoformat(end)
+        except ValueError:
+            return {"error": f"Invalid date range: {start}..{end}. Use YYYY-MM-DD."}
+        if end_date < start_date:
+            return {"error": "end must not be before start"}
+        span_days = (end_date - start_date).days + 1
+        if span_days > settings.backfill_max_days:
+            return {
+                "error": f"Range spans {span_days} days; "
+                f"the maximum is {settings.backfill_max_days} (BACKFILL_MAX_DAYS)"
+            }
+        
+        dates = [
+            start_date + timedelta(days=offset)
+            for offset in range(span_days)
+        ]
+        provider_manager = request.app.state.provider_manager
+        
+        async def events():
+            succeeded = 0
+            async for result in run_range_pipeline(dates, provider_manager, force=force):
+                succeeded += bool(result.get("success"))
+                yield f"data: {json.dumps(result)}\n\n"
+            summary = {"total": len(dates), "succeeded": succeeded, "failed": len(dates) - succeeded}
+            yield f"event: done\ndata: {json.dumps(summary)}\n\n"
+        
+        return StreamingResponse(events(), media_type="text/event-stream")
+    
     # Manual trigger endpoint (for gap-filling and testing)
     @app.post("/api/v1/trigger/{date_str}")
-    async def trigger_pipeline(date_str: str):
+    async def trigger_pipeline(request: Request, date_str: str, force: bool = False):
         """
         🔒 REQ-1.7: Manual trigger capability for gap-filling and corrections.
         
         Args:
             date_str: ISO 8601 date (YYYY-MM-DD)
+            force: Recompute even if the date was already computed
         """
         try:
             target_date = date.fromisoformat(date_str)
         except ValueError:
             return {"error": f"Invalid date format: {date_str}. Use YYYY-MM-DD."}
         
-        result = await run_daily_pipeline(target_date)
-        return result
+        result = await run_daily_pipeline(
+            target_date, request.app.state.provider_manager, force=force
+        )
+        return KolmoJSONResponse(result)
     
     @app.get("/")
     async def root():
@@ -264,7 +619,8 @@ def create_app() -> FastAPI:
                 "winner_latest": "/api/v1/winner/latest",
                 "rates_by_date": "/api/v1/rates/{date}",
                 "health": "/api/v1/health",
-                "trigger": "/api/v1/trigger/{date}"
+                "trigger": "/api/v1/trigger/{date}",
+                "trigger_range": "/api/v1/trigger/range?start={date}&end={date}"
             }
         }
     
@@ -279,13 +635,17 @@ def main():
     """Main entry point for running the server."""
     settings = get_settings()
     
-    logger.info(f"Starting KOLMO server on {settings.api_host}:{settings.api_port}")
+    logger.info("Starting KOLMO server on %s:%s", settings.api_host, settings.api_port)
     
     uvicorn.run(
         "kolmo.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=False,
+        # "auto" picks uvloop/httptools when installed (not on Windows)
+        loop="auto",
+        http="auto",
+        workers=settings.uvicorn_workers,
         log_level=settings.log_level.lower()
     )
 
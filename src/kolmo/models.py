@@ -8,13 +8,63 @@ REQ-4.1: All database identifiers MUST use snake_case.
 REQ-4.5: winner_reason JSONB column MUST contain explainability metadata.
 """
 
+import os
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Literal
-from uuid import UUID, uuid4
+from typing import Any, ClassVar, Literal
+from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, model_validator
+
+
+# === Identifiers ===
+
+_UUID_POOL_SIZE = 256
+_uuid_pool: list[UUID] = []
+
+
+def uuid4_batch(n: int) -> list[UUID]:
+    """Generate n random (version 4) UUIDs from a single os.urandom read."""
+    raw = os.urandom(16 * n)
+    return [UUID(bytes=raw[i:i + 16], version=4) for i in range(0, 16 * n, 16)]
+
+
+def next_uuid4() -> UUID:
+    """
+    Drop-in for uuid.uuid4() backed by a pre-generated pool.
+    
+    Pipelines need four IDs per date; pooling turns one urandom syscall
+    per ID into one per _UUID_POOL_SIZE IDs.
+    """
+    if not _uuid_pool:
+        _uuid_pool.extend(uuid4_batch(_UUID_POOL_SIZE))
+    return _uuid_pool.pop()
+
+
+# A forked worker must never hand out the parent's remaining IDs
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def _coerce_decimals(data: Any, fields: tuple[str, ...]) -> Any:
+    """
+    🔒 REQ-2.1: Convert raw numeric inputs to Decimal in a single pass.
+    
+    Already-Decimal and None values are left untouched; the input dict is
+    copied only when a conversion is actually needed.
+    """
+    if not isinstance(data, dict):
+        return data
+    copied = False
+    for name in fields:
+        v = data.get(name)
+        if v is None or isinstance(v, Decimal):
+            continue
+        if not copied:
+            data = dict(data)
+            copied = True
+        data[name] = Decimal(str(v))
+    return data
 
 
 # === Enums ===
@@ -125,19 +175,19 @@ class ExternalDataCreate(BaseModel):
     eur_aed_pair_desc: CurrencyPair | None = CurrencyPair.EUR_AED
     
     # Audit trail
-    mcol1_snapshot_id: UUID = Field(default_factory=uuid4)
-    trace_id: UUID = Field(default_factory=uuid4)
+    mcol1_snapshot_id: UUID = Field(default_factory=next_uuid4)
+    trace_id: UUID = Field(default_factory=next_uuid4)
     sources: dict[str, Any] = Field(default_factory=dict)
     
-    @field_validator("eur_usd", "eur_cny", "eur_rub", "eur_inr", "eur_aed", mode="before")
+    _NUMERIC_FIELDS: ClassVar[tuple[str, ...]] = (
+        "eur_usd", "eur_cny", "eur_rub", "eur_inr", "eur_aed",
+    )
+    
+    @model_validator(mode="before")
     @classmethod
-    def convert_to_decimal(cls, v: Any) -> Decimal | None:
+    def convert_to_decimal(cls, data: Any) -> Any:
         """🔒 REQ-2.1: Ensure all rates are Decimal type."""
-        if v is None:
-            return None
-        if isinstance(v, Decimal):
-            return v
-        return Decimal(str(v))
+        return _coerce_decimals(data, cls._NUMERIC_FIELDS)
 
 
 class ExternalData(ExternalDataCreate):
@@ -180,13 +230,13 @@ class KolmoRates(BaseModel):
         description="UOME coin = CNY/EUR (Chinese Yuan per 1 Euro). Example: 8.11 means 1 euro = 8.11 yuan"
     )
     
-    @field_validator("r_me4u", "r_iou2", "r_uome", mode="before")
+    _NUMERIC_FIELDS: ClassVar[tuple[str, ...]] = ("r_me4u", "r_iou2", "r_uome")
+    
+    @model_validator(mode="before")
     @classmethod
-    def convert_to_decimal(cls, v: Any) -> Decimal:
+    def convert_to_decimal(cls, data: Any) -> Any:
         """🔒 REQ-2.1: Ensure all rates are Decimal type."""
-        if isinstance(v, Decimal):
-            return v
-        return Decimal(str(v))
+        return _coerce_decimals(data, cls._NUMERIC_FIELDS)
 
 
 class ComputeDataCreate(BaseModel):
@@ -235,8 +285,8 @@ class ComputeDataCreate(BaseModel):
     mcol1_snapshot_id: UUID = Field(
         description="FK to mcol1_external_data.mcol1_snapshot_id"
     )
-    mcol1_snapshot_compute_id: UUID = Field(default_factory=uuid4)
-    trace_compute_id: UUID = Field(default_factory=uuid4)
+    mcol1_snapshot_compute_id: UUID = Field(default_factory=next_uuid4)
+    trace_compute_id: UUID = Field(default_factory=next_uuid4)
     
     @model_validator(mode="after")
     def validate_kolmo_exact_product(self) -> "ComputeDataCreate":
@@ -253,21 +303,18 @@ class ComputeDataCreate(BaseModel):
             )
         return self
     
-    @field_validator(
+    _NUMERIC_FIELDS: ClassVar[tuple[str, ...]] = (
         "r_me4u", "r_iou2", "r_uome", "kolmo_value", "kolmo_deviation",
         "dist_me4u", "dist_iou2", "dist_uome",
         "relpath_me4u", "relpath_iou2", "relpath_uome",
         "vol_me4u", "vol_iou2", "vol_uome",
-        mode="before"
     )
+    
+    @model_validator(mode="before")
     @classmethod
-    def convert_to_decimal(cls, v: Any) -> Decimal | None:
+    def convert_to_decimal(cls, data: Any) -> Any:
         """🔒 REQ-2.1: Ensure all numeric values are Decimal type."""
-        if v is None:
-            return None
-        if isinstance(v, Decimal):
-            return v
-        return Decimal(str(v))
+        return _coerce_decimals(data, cls._NUMERIC_FIELDS)
 
 
 class ComputeData(ComputeDataCreate):
@@ -5,6 +5,7 @@ KOLMO Data Providers Module
 """
 
 from kolmo.providers.base import BaseRateProvider, RateProviderError
+from kolmo.providers.breaker import CircuitBreaker, CircuitOpenError
 from kolmo.providers.frankfurter import FrankfurterClient
 from kolmo.providers.cbr import CBRClient
 from kolmo.providers.twelvedata import TwelveDataClient
@@ -13,6 +14,8 @@ from kolmo.providers.manager import ProviderManager
 __all__ = [
     "BaseRateProvider",
     "RateProviderError",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "FrankfurterClient",
     "CBRClient",
     "TwelveDataClient",
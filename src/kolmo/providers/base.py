@@ -4,10 +4,50 @@ Base Rate Provider Interface
 🔒 REQ-2.1: All rates MUST be returned as decimal.Decimal type.
 """
 
+import asyncio
+import importlib.util
+import logging
+import random
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any
 
+import httpx
+
+from kolmo.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Shared HTTP settings: fail fast on connect and on pool starvation, allow
+# slower reads, keep warm connections around
+HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=5.0)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=60.0
+)
+
+# Connect-level failures are retried inside the transport
+TRANSPORT_RETRIES = 3
+
+# HTTP/2 multiplexing needs the optional h2 package (pip install kolmo-wiazor[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Application-level retry policy (5xx / 429): exponential backoff, full jitter
+MAX_ATTEMPTS = 3
+MAX_BACKOFF_SECONDS = 10
+# Longest server-requested Retry-After we are willing to wait out
+MAX_RETRY_AFTER_SECONDS = 60
+# Transient HTTP statuses: timeout, too early, rate limited, server errors
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@lru_cache(maxsize=4096)
+def _decimal_from_str(text: str) -> Decimal:
+    """Shared Decimal per distinct rate string (Decimals are immutable)."""
+    return Decimal(text)
+
 
 class RateProviderError(Exception):
     """Base exception for rate provider errors."""
@@ -34,6 +74,9 @@ class BaseRateProvider(ABC):
     
     PROVIDER_NAME: str = "base"
     
+    _client: httpx.AsyncClient | None = None
+    _semaphore: asyncio.Semaphore | None = None
+    
     @abstractmethod
     async def fetch_rates(self, date: str) -> dict[str, Decimal]:
         """
@@ -56,12 +99,117 @@ class BaseRateProvider(ABC):
         """Check if provider is reachable and responding."""
         pass
     
-    def _to_decimal(self, value: Any) -> Decimal:
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Return this provider's pooled HTTP client, creating it on first use.
+        
+        One client per provider instance means retries, health checks and
+        daily fetches reuse keep-alive connections instead of paying a
+        TCP+TLS handshake per request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=HTTP_TIMEOUT,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=TRANSPORT_RETRIES,
+                    limits=HTTP_LIMITS,
+                    http2=HTTP2_ENABLED
+                )
+            )
+        return self._client
+    
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """Per-provider cap on in-flight requests (PROVIDER_MAX_CONCURRENCY)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(get_settings().provider_max_concurrency)
+        return self._semaphore
+    
+    async def _get_with_retry(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        timeout: float | None = None,
+        headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """
+        GET with retries on transient statuses and transport errors.
+        
+        Backoff is exponential with full jitter so parallel backfill workers
+        do not retry in lockstep. A numeric Retry-After (429/503) is honored
+        up to MAX_RETRY_AFTER_SECONDS, plus up to 25% jitter; longer waits
+        give up. 304 Not Modified is returned as-is for conditional GETs.
+        """
+        kwargs = {"params": params, "headers": headers}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        
+        attempt = 0
+        while True:
+            try:
+                # Backoff sleeps happen outside the limit so waiting retries
+                # do not hold a slot
+                async with self._concurrency_limit():
+                    response = await self._get_client().get(url, **kwargs)
+                if response.status_code != 304:
+                    response.raise_for_status()
+                return response
+            except (httpx.TransportError, httpx.HTTPStatusError) as e:
+                attempt += 1
+                delay = random.uniform(0, min(2 ** attempt, MAX_BACKOFF_SECONDS))
+                if isinstance(e, httpx.HTTPStatusError):
+                    status = e.response.status_code
+                    if status not in RETRYABLE_STATUS:
+                        raise
+                    retry_after = e.response.headers.get("Retry-After", "")
+                    if retry_after.isdigit():
+                        wait = float(retry_after)
+                        if wait > MAX_RETRY_AFTER_SECONDS:
+                            raise
+                        delay = wait + random.uniform(0, wait * 0.25)
+                if attempt >= MAX_ATTEMPTS:
+                    raise
+                logger.debug(
+                    "%s attempt %s failed (%s), retrying in %.2fs",
+                    self.PROVIDER_NAME, attempt, e, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def _error(self, message: str, error_type: str, **details: Any) -> RateProviderError:
+        """Build a RateProviderError tagged with this provider."""
+        return RateProviderError(
+            message=message,
+            provider=self.PROVIDER_NAME,
+            error_type=error_type,
+            details=details
+        )
+    
+    def _http_error(self, e: Exception, timeout: float | None = None) -> RateProviderError:
+        """Map an HTTP/transport exception to RateProviderError (others → UNKNOWN)."""
+        if isinstance(e, RateProviderError):
+            return e
+        if isinstance(e, httpx.HTTPStatusError):
+            status = e.response.status_code
+            return self._error(f"HTTP error: {status}", f"HTTP_{status}", url=str(e.request.url))
+        if isinstance(e, httpx.TimeoutException):
+            return self._error("Request timeout", "TIMEOUT", timeout_seconds=timeout)
+        return self._error(str(e), "UNKNOWN")
+    
+    def _to_decimal(self, value: Any) -> Decimal | None:
         """
-        🔒 REQ-2.1: Convert value to exact Decimal.
+        🔒 REQ-2.1: Convert value to exact Decimal (None stays None).
         
-        NEVER use float conversion - always use str intermediate.
+        NEVER use float conversion - always use str intermediate. For JSON
+        floats, str() yields the shortest repr, which round-trips the
+        provider's published digits exactly.
         """
-        if isinstance(value, Decimal):
+        if value is None or isinstance(value, Decimal):
             return value
-        return Decimal(str(value))
+        if not isinstance(value, str):
+            value = str(value)
+        return _decimal_from_str(value)
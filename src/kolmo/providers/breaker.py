@@ -0,0 +1,98 @@
+"""
+Per-provider Circuit Breaker
+
+After repeated consecutive failures a provider is skipped (fail-fast) for a
+cooldown period instead of burning its full retry budget on every call.
+Breakers are process-wide so state survives across pipeline runs.
+"""
+
+import time
+
+from kolmo.providers.base import RateProviderError
+
+
+class CircuitOpenError(RateProviderError):
+    """Raised when a call is rejected because the provider's circuit is open."""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(
+            message=f"Circuit open for {provider}, retry in {retry_in:.0f}s",
+            provider=provider,
+            error_type="CIRCUIT_OPEN",
+            details={"retry_in_seconds": round(retry_in, 1)}
+        )
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `failure_threshold` consecutive failures.
+
+    Once `recovery_timeout` seconds have passed, one trial call is allowed
+    (half-open): success closes the circuit, failure re-opens it.
+
+    Usage:
+        async with breaker:
+            rates = await client.fetch_rates(date)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 60.0
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def _check(self) -> None:
+        if self.opened_at is None:
+            return
+        elapsed = time.monotonic() - self.opened_at
+        if elapsed < self.recovery_timeout or self._trial_in_flight:
+            raise CircuitOpenError(self.name, max(self.recovery_timeout - elapsed, 0.0))
+        # Half-open: let exactly one trial call through
+        self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+    async def __aenter__(self) -> "CircuitBreaker":
+        self._check()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            self.record_success()
+        elif issubclass(exc_type, Exception):
+            self.record_failure()
+        else:
+            # Cancellation (e.g. a losing hedged request) is not a provider fault
+            self._trial_in_flight = False
+        return False
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    """Return the process-wide breaker for a provider, creating it on first use."""
+    breaker = _BREAKERS.get(name)
+    if breaker is None:
+        breaker = _BREAKERS[name] = CircuitBreaker(name)
+    return breaker
@@ -6,18 +6,18 @@ API Documentation: https://www.cbr.ru/development/SXML/
 """
 
 import logging
-import xml.etree.ElementTree as ET
-from datetime import datetime
+import re
+from xml.parsers import expat
 from decimal import Decimal
 
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
-
+from kolmo.cache import get_cached_rates, store_cached_rates
 from kolmo.config import get_settings
-from kolmo.providers.base import BaseRateProvider, RateProviderError
+from kolmo.providers.base import HTTP_TIMEOUT, BaseRateProvider, RateProviderError
 
 logger = logging.getLogger(__name__)
 
+_ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
 
 class CBRClient(BaseRateProvider):
     """
@@ -48,10 +48,6 @@ class CBRClient(BaseRateProvider):
         self.settings = get_settings()
         self.base_url = self.settings.cbr_base_url
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10)
-    )
     async def fetch_rates(self, date: str) -> dict[str, Decimal]:
         """
         Fetch rates from CBR and convert to EUR-based.
@@ -62,110 +58,151 @@ class CBRClient(BaseRateProvider):
         Returns:
             Dict with keys: eur_usd, eur_cny, eur_rub, eur_inr, eur_aed
         """
-        # Convert date format for CBR (DD/MM/YYYY)
-        date_obj = datetime.strptime(date, "%Y-%m-%d")
-        cbr_date = date_obj.strftime("%d/%m/%Y")
+        # Convert date format for CBR (DD/MM/YYYY) by slicing the ISO string
+        if _ISO_DATE.fullmatch(date) is None:
+            raise ValueError(f"Invalid ISO date: {date!r}")
+        cbr_date = f"{date[8:10]}/{date[5:7]}/{date[:4]}"
+        
+        cached = await get_cached_rates(self.PROVIDER_NAME, date)
+        if cached is not None:
+            return cached
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.base_url,
-                    params={"date_req": cbr_date}
-                )
-                response.raise_for_status()
+            response = await self._get_with_retry(self.base_url, {"date_req": cbr_date})
             
-            # Parse XML response
-            root = ET.fromstring(response.content)
-            
-            # Extract rates (all rates are against RUB)
-            rates_rub: dict[str, Decimal] = {}
-            
-            for valute in root.findall("Valute"):
-                char_code = valute.find("CharCode")
-                value = valute.find("Value")
-                nominal = valute.find("Nominal")
-                if char_code is not None and value is not None and nominal is not None:
-                    code = char_code.text
-                    if code in self.CURRENCY_CODES:
-                        # CBR uses comma as decimal separator
-                        rate_value = Decimal(value.text.replace(",", "."))
-                        nominal_value = Decimal(nominal.text)
-                        # Rate per 1 unit
-                        rates_rub[code] = rate_value / nominal_value
+            # SAX-parse XML, stopping once every wanted currency is seen
+            # (all rates are against RUB)
+            rates_rub = _ExpatCBRParser().parse(response.content)
             
             # Validate required currencies
             if "EUR" not in rates_rub or "USD" not in rates_rub:
-                raise RateProviderError(
-                    message="Missing EUR or USD in CBR response",
-                    provider=self.PROVIDER_NAME,
-                    error_type="MISSING_CURRENCY",
-                    details={"available": list(rates_rub.keys())}
+                raise self._error(
+                    "Missing EUR or USD in CBR response",
+                    "MISSING_CURRENCY",
+                    available=list(rates_rub.keys())
                 )
             
             # Cross-calculate EUR-based rates
             # EUR/USD = (RUB/USD) / (RUB/EUR) = EUR_rate_rub / USD_rate_rub
             eur_rate_rub = rates_rub["EUR"]
             
-            result = {
-                "eur_usd": eur_rate_rub / rates_rub["USD"] if "USD" in rates_rub else None,
-                "eur_cny": eur_rate_rub / rates_rub["CNY"] if "CNY" in rates_rub else None,
-                "eur_rub": eur_rate_rub,  # EUR/RUB direct
-                "eur_inr": eur_rate_rub / rates_rub["INR"] if "INR" in rates_rub else None,
-                "eur_aed": eur_rate_rub / rates_rub["AED"] if "AED" in rates_rub else None,
-                "eur_cad": eur_rate_rub / rates_rub["CAD"] if "CAD" in rates_rub else None,
-                "eur_sgd": eur_rate_rub / rates_rub["SGD"] if "SGD" in rates_rub else None,
-                "eur_thb": eur_rate_rub / rates_rub["THB"] if "THB" in rates_rub else None,
-                "eur_vnd": eur_rate_rub / rates_rub["VND"] if "VND" in rates_rub else None,
-                "eur_hkd": eur_rate_rub / rates_rub["HKD"] if "HKD" in rates_rub else None,
-                "eur_huf": eur_rate_rub / rates_rub["HUF"] if "HUF" in rates_rub else None,
-            }
+            result: dict[str, Decimal | None] = {"eur_rub": eur_rate_rub}  # EUR/RUB direct
+            get_rate = rates_rub.get
+            for out_key, code in _CROSS_PAIRS:
+                rate = get_rate(code)
+                result[out_key] = eur_rate_rub / rate if rate is not None else None
             
             logger.info(
-                f"CBR fetched rates for {date}: "
-                f"EUR/USD={result['eur_usd']}, EUR/CNY={result.get('eur_cny')}"
+                "CBR fetched rates for %s: EUR/USD=%s, EUR/CNY=%s",
+                date, result['eur_usd'], result.get('eur_cny')
             )
             
-            return result
-            
-        except ET.ParseError as e:
-            raise RateProviderError(
-                message=f"XML parse error: {e}",
-                provider=self.PROVIDER_NAME,
-                error_type="PARSE_ERROR",
-                details={}
-            ) from e
-            
-        except httpx.HTTPStatusError as e:
-            raise RateProviderError(
-                message=f"HTTP error: {e.response.status_code}",
-                provider=self.PROVIDER_NAME,
-                error_type=f"HTTP_{e.response.status_code}",
-                details={"url": str(e.request.url)}
-            ) from e
-            
-        except httpx.TimeoutException as e:
-            raise RateProviderError(
-                message="Request timeout",
-                provider=self.PROVIDER_NAME,
-                error_type="TIMEOUT",
-                details={"timeout_seconds": 10}
-            ) from e
+        except expat.ExpatError as e:
+            raise self._error(f"XML parse error: {e}", "PARSE_ERROR") from e
             
         except Exception as e:
             if isinstance(e, RateProviderError):
                 raise
-            raise RateProviderError(
-                message=str(e),
-                provider=self.PROVIDER_NAME,
-                error_type="UNKNOWN",
-                details={}
-            ) from e
+            raise self._http_error(e, timeout=HTTP_TIMEOUT.read) from e
+        
+        # Outside the try: a cache failure must not turn a good fetch into an error
+        await store_cached_rates(self.PROVIDER_NAME, date, result)
+        
+        return result
     
     async def health_check(self) -> bool:
         """Check if CBR API is reachable."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(self.base_url)
-                return response.status_code == 200
+            response = await self._get_client().get(self.base_url, timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
+
+
+# Precomputed lookups used on every parse
+_WANTED: frozenset[str] = frozenset(CBRClient.CURRENCY_CODES)
+_WANTED_COUNT = len(_WANTED)
+
+# CBR uses comma as decimal separator; translate() is a single C-level pass
+_COMMA_TRANS = str.maketrans(",", ".")
+
+# (result key, RUB-quoted CharCode) for EUR cross rates; EUR/RUB is direct
+_CROSS_PAIRS: tuple[tuple[str, str], ...] = (
+    ("eur_usd", "USD"),
+    ("eur_cny", "CNY"),
+    ("eur_inr", "INR"),
+    ("eur_aed", "AED"),
+    ("eur_cad", "CAD"),
+    ("eur_sgd", "SGD"),
+    ("eur_thb", "THB"),
+    ("eur_vnd", "VND"),
+    ("eur_hkd", "HKD"),
+    ("eur_huf", "HUF"),
+)
+
+
+class _StopParsing(Exception):
+    """Raised from expat callbacks once every wanted currency is collected."""
+
+
+class _ExpatCBRParser:
+    """
+    Streaming parser for the fixed ValCurs/Valute document shape.
+    
+    Expat callbacks feed a tiny state machine that keeps only the
+    CharCode/Value/Nominal text of each Valute; no element tree is built.
+    CharCode precedes Nominal/Value in CBR documents, so Valutes we do not
+    track (~2/3 of them) are skipped without collecting their other fields.
+    """
+    
+    __slots__ = ("rates_rub", "_field", "_text", "_current", "_skip")
+    
+    _FIELDS = frozenset({"CharCode", "Value", "Nominal"})
+    
+    def __init__(self):
+        self.rates_rub: dict[str, Decimal] = {}
+        self._field: str | None = None
+        self._text: list[str] = []
+        self._current: dict[str, str] = {}
+        self._skip = False
+    
+    def parse(self, data: bytes) -> dict[str, Decimal]:
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._chars
+        try:
+            parser.Parse(data, True)
+        except _StopParsing:
+            pass
+        return self.rates_rub
+    
+    def _start(self, name: str, attrs: dict[str, str]) -> None:
+        if name in self._FIELDS and not self._skip:
+            self._field = name
+            self._text.clear()
+        elif name == "Valute":
+            self._current = {}
+            self._skip = False
+    
+    def _chars(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+    
+    def _end(self, name: str) -> None:
+        if name == self._field:
+            text = "".join(self._text)
+            self._field = None
+            if name == "CharCode" and text not in _WANTED:
+                self._skip = True
+                return
+            self._current[name] = text
+        elif name == "Valute":
+            code = self._current.get("CharCode")
+            value = self._current.get("Value")
+            nominal = self._current.get("Nominal")
+            if code in _WANTED and value is not None and nominal is not None:
+                # Rate per 1 unit
+                self.rates_rub[code] = Decimal(value.translate(_COMMA_TRANS)) / Decimal(nominal)
+                if len(self.rates_rub) == _WANTED_COUNT:
+                    raise _StopParsing
@@ -6,17 +6,50 @@ API Documentation: https://www.frankfurter.app/docs/
 """
 
 import logging
-from datetime import date as date_type
-from decimal import Decimal
+from collections import OrderedDict
+from datetime import date as date_type, timedelta
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any
 
-import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import orjson
 
+from kolmo.cache import get_cached_rates, store_cached_rates
 from kolmo.config import get_settings
-from kolmo.providers.base import BaseRateProvider, RateProviderError
+from kolmo.providers.base import BaseRateProvider
 
 logger = logging.getLogger(__name__)
 
+# Parsed bodies kept for conditional GETs (If-None-Match → 304)
+ETAG_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _json_number_to_decimal(value: float | int | None) -> Decimal | None:
+    """
+    🔒 REQ-2.1: Memoized JSON number → exact Decimal (via str, never float).
+    
+    Rates repeat heavily across a multi-year bulk payload, so conversions
+    collapse to the number of distinct values. Decimals are immutable and
+    safe to share; typed=True keeps 1 and 1.0 apart.
+    """
+    return None if value is None else Decimal(str(value))
+
+
+def _ecb_publication_day(date: str) -> str:
+    """
+    Map a date to the ECB publication day whose rates apply to it.
+    
+    ECB does not publish on weekends and Frankfurter answers Saturday and
+    Sunday with Friday's rates, so weekends share Friday's cache slot.
+    TARGET holidays are not modelled; they still cost one request each.
+    """
+    day = date_type.fromisoformat(date)
+    weekday = day.weekday()
+    if weekday < 5:
+        return date
+    return (day - timedelta(days=weekday - 4)).isoformat()
+
 
 class FrankfurterClient(BaseRateProvider):
     """
@@ -31,14 +64,83 @@ class FrankfurterClient(BaseRateProvider):
         "USD", "CNY", "RUB", "INR", "AED", "CAD", "SGD", "THB", "VND", "HKD", "HUF"
     }
     
+    # Single-day endpoint: (output key, currency code)
+    DAILY_CODES = (
+        ("eur_usd", "USD"), ("eur_cny", "CNY"), ("eur_rub", "RUB"), ("eur_inr", "INR"),
+        ("eur_aed", "AED"), ("eur_cad", "CAD"), ("eur_sgd", "SGD"), ("eur_thb", "THB"),
+        ("eur_vnd", "VND"), ("eur_hkd", "HKD"), ("eur_huf", "HUF"),
+    )
+    
+    # Bulk endpoint: (output key, currency code) for what ECB actually publishes
+    BULK_CODES = (
+        ("eur_usd", "USD"), ("eur_cny", "CNY"), ("eur_inr", "INR"), ("eur_cad", "CAD"),
+        ("eur_sgd", "SGD"), ("eur_thb", "THB"), ("eur_hkd", "HKD"), ("eur_huf", "HUF"),
+    )
+    # RUB, AED, VND are NOT available from Frankfurter/ECB
+    _BULK_UNAVAILABLE = {"eur_rub": None, "eur_aed": None, "eur_vnd": None}
+    
+    # Query params built once; sorted symbols keep URLs stable for HTTP caches
+    _DAILY_PARAMS = {"base": "EUR", "symbols": ",".join(sorted(REQUIRED_CURRENCIES))}
+    _BULK_PARAMS = {"base": "EUR", "symbols": ",".join(sorted(code for _, code in BULK_CODES))}
+    
     def __init__(self):
         self.settings = get_settings()
         self.base_url = self.settings.frankfurter_base_url
+        # request key → (ETag, parsed body)
+        self._etags: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+    
+    async def _get_json(
+        self,
+        url: str,
+        params: dict[str, str],
+        timeout: float = 10.0
+    ) -> dict[str, Any]:
+        """
+        GET a Frankfurter endpoint and return the validated JSON body.
+        
+        Retries are handled by the transport (connect) and _get_with_retry
+        (5xx/429); failures are mapped to RateProviderError here so
+        single-day and bulk requests report errors the same way.
+        
+        Bodies are revalidated with If-None-Match: a 304 reuses the body
+        parsed last time instead of downloading and decoding it again.
+        """
+        key = f"{url}?{sorted(params.items())}"
+        known = self._etags.get(key)
+        headers = {"If-None-Match": known[0]} if known is not None else None
+        try:
+            response = await self._get_with_retry(url, params, timeout=timeout, headers=headers)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Frankfurter %s: %s, content-encoding=%s, %s bytes",
+                    url, response.http_version,
+                    response.headers.get("content-encoding", "identity"),
+                    response.num_bytes_downloaded
+                )
+            if response.status_code == 304 and known is not None:
+                self._etags.move_to_end(key)
+                return known[1]
+            # Bulk payloads are hundreds of KB; orjson decodes them several times faster
+            data = orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise self._error(f"Invalid JSON: {e}", "PARSE_ERROR", url=url) from e
+        except Exception as e:
+            raise self._http_error(e, timeout=timeout) from e
+        
+        # Validate response structure
+        if "rates" not in data:
+            raise self._error(
+                "Invalid response: missing 'rates' field", "PARSE_ERROR", response=data
+            )
+        
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[key] = (etag, data)
+            self._etags.move_to_end(key)
+            while len(self._etags) > ETAG_CACHE_SIZE:
+                self._etags.popitem(last=False)
+        return data
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10)
-    )
     async def fetch_rates(self, date: str) -> dict[str, Decimal]:
         """
         Fetch EUR-based rates from Frankfurter API.
@@ -52,102 +154,55 @@ class FrankfurterClient(BaseRateProvider):
         Raises:
             RateProviderError: If API returns error or missing currencies
         """
-        params = {
-            "base": "EUR",
-            "symbols": ",".join(self.REQUIRED_CURRENCIES)
-        }
+        date = _ecb_publication_day(date)
+        cached = await get_cached_rates(self.PROVIDER_NAME, date)
+        if cached is not None:
+            return cached
         
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/v1/{date}",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-            
-            # Validate response structure
-            if "rates" not in data:
-                raise RateProviderError(
-                    message="Invalid response: missing 'rates' field",
-                    provider=self.PROVIDER_NAME,
-                    error_type="PARSE_ERROR",
-                    details={"response": data}
-                )
-            
-            # Check for missing currencies
-            received = set(data["rates"].keys())
-            missing = self.REQUIRED_CURRENCIES - received
-            if missing:
-                logger.warning(
-                    f"Frankfurter missing currencies: {missing}. "
-                    f"Available: {received}"
-                )
-                # Don't fail - some currencies may not be available on weekends
-            
-            # 🔒 REQ-2.1: Convert to exact Decimal
-            rates = {
-                "eur_usd": self._to_decimal(data["rates"].get("USD")),
-                "eur_cny": self._to_decimal(data["rates"].get("CNY")),
-                "eur_rub": self._to_decimal(data["rates"].get("RUB")),
-                "eur_inr": self._to_decimal(data["rates"].get("INR")),
-                "eur_aed": self._to_decimal(data["rates"].get("AED")),
-                "eur_cad": self._to_decimal(data["rates"].get("CAD")),
-                "eur_sgd": self._to_decimal(data["rates"].get("SGD")),
-                "eur_thb": self._to_decimal(data["rates"].get("THB")),
-                "eur_vnd": self._to_decimal(data["rates"].get("VND")),
-                "eur_hkd": self._to_decimal(data["rates"].get("HKD")),
-                "eur_huf": self._to_decimal(data["rates"].get("HUF")),
-            }
-            
-            # Validate required rates present
-            if rates["eur_usd"] is None or rates["eur_cny"] is None:
-                raise RateProviderError(
-                    message="Missing required currencies: USD or CNY",
-                    provider=self.PROVIDER_NAME,
-                    error_type="MISSING_CURRENCY",
-                    details={"available": list(received)}
-                )
-            
-            logger.info(
-                f"Frankfurter fetched rates for {date}: "
-                f"EUR/USD={rates['eur_usd']}, EUR/CNY={rates['eur_cny']}"
+        data = await self._get_json(f"{self.base_url}/v1/{date}", self._DAILY_PARAMS)
+        
+        # Check for missing currencies
+        received = set(data["rates"].keys())
+        missing = self.REQUIRED_CURRENCIES - received
+        if missing:
+            logger.warning(
+                "Frankfurter missing currencies: %s. Available: %s",
+                missing, received
             )
-            
-            return rates
-            
-        except httpx.HTTPStatusError as e:
-            raise RateProviderError(
-                message=f"HTTP error: {e.response.status_code}",
-                provider=self.PROVIDER_NAME,
-                error_type=f"HTTP_{e.response.status_code}",
-                details={"url": str(e.request.url)}
-            ) from e
-            
-        except httpx.TimeoutException as e:
-            raise RateProviderError(
-                message="Request timeout",
-                provider=self.PROVIDER_NAME,
-                error_type="TIMEOUT",
-                details={"timeout_seconds": 10}
-            ) from e
-            
-        except Exception as e:
-            if isinstance(e, RateProviderError):
-                raise
-            raise RateProviderError(
-                message=str(e),
-                provider=self.PROVIDER_NAME,
-                error_type="UNKNOWN",
-                details={}
+            # Don't fail - some currencies may not be available on weekends
+        
+        # 🔒 REQ-2.1: Convert to exact Decimal
+        try:
+            to_dec = _json_number_to_decimal
+            day_rates = data["rates"]
+            rates = {out: to_dec(day_rates.get(src)) for out, src in self.DAILY_CODES}
+        except (InvalidOperation, TypeError, ValueError) as e:
+            raise self._error(
+                f"Unparseable rate value: {e}", "PARSE_ERROR", rates=data["rates"]
             ) from e
+        
+        # Validate required rates present
+        if rates["eur_usd"] is None or rates["eur_cny"] is None:
+            raise self._error(
+                "Missing required currencies: USD or CNY",
+                "MISSING_CURRENCY",
+                available=list(received)
+            )
+        
+        logger.info(
+            "Frankfurter fetched rates for %s: EUR/USD=%s, EUR/CNY=%s",
+            date, rates['eur_usd'], rates['eur_cny']
+        )
+        
+        await store_cached_rates(self.PROVIDER_NAME, date, rates)
+        
+        return rates
     
     async def health_check(self) -> bool:
         """Check if Frankfurter API is reachable."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/latest")
-                return response.status_code == 200
+            response = await self._get_client().get(f"{self.base_url}/latest", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -177,100 +232,36 @@ class FrankfurterClient(BaseRateProvider):
         Raises:
             RateProviderError: If API returns error
         """
-        # Request only currencies that Frankfurter actually provides
-        # RUB, AED, VND are NOT available from Frankfurter/ECB
-        available_currencies = {"USD", "CNY", "INR", "CAD", "SGD", "THB", "HKD", "HUF"}
+        url = f"{self.base_url}/v1/{start_date}..{end_date}"
+        logger.info("Frankfurter bulk request: %s to %s", start_date, end_date)
         
-        params = {
-            "base": "EUR",
-            "symbols": ",".join(available_currencies)
-        }
+        # Use extended timeout for bulk requests
+        data = await self._get_json(url, self._BULK_PARAMS, timeout=120.0)
         
-        max_retries = 3
-        last_error = None
+        # data["rates"] is a dict: {"2021-07-01": {"USD": 1.18, ...}, ...}
+        # Hot loop over years of days: bind lookups to locals once
+        to_dec = _json_number_to_decimal
+        codes = self.BULK_CODES
+        unavailable = self._BULK_UNAVAILABLE
         
-        for attempt in range(max_retries):
-            try:
-                # Use extended timeout for bulk requests
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    url = f"{self.base_url}/v1/{start_date}..{end_date}"
-                    logger.info(f"Frankfurter bulk request: {start_date} to {end_date} (attempt {attempt + 1}/{max_retries})")
-                    
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-                
-                # Validate response structure
-                if "rates" not in data:
-                    raise RateProviderError(
-                        message="Invalid response: missing 'rates' field",
-                        provider=self.PROVIDER_NAME,
-                        error_type="PARSE_ERROR",
-                        details={"response": data}
-                    )
-                
-                # data["rates"] is a dict: {"2021-07-01": {"USD": 1.18, ...}, ...}
-                results = {}
-                
-                for date_str, day_rates in data["rates"].items():
-                    # Convert to our format with Decimal values
-                    # Note: RUB, AED, VND will be None - they're not available from Frankfurter
-                    results[date_str] = {
-                        "eur_usd": self._to_decimal(day_rates.get("USD")),
-                        "eur_cny": self._to_decimal(day_rates.get("CNY")),
-                        "eur_rub": None,  # Not available from Frankfurter
-                        "eur_inr": self._to_decimal(day_rates.get("INR")),
-                        "eur_aed": None,  # Not available from Frankfurter
-                        "eur_cad": self._to_decimal(day_rates.get("CAD")),
-                        "eur_sgd": self._to_decimal(day_rates.get("SGD")),
-                        "eur_thb": self._to_decimal(day_rates.get("THB")),
-                        "eur_vnd": None,  # Not available from Frankfurter
-                        "eur_hkd": self._to_decimal(day_rates.get("HKD")),
-                        "eur_huf": self._to_decimal(day_rates.get("HUF")),
-                    }
-                
-                logger.info(
-                    f"Frankfurter bulk fetched {len(results)} dates: "
-                    f"{start_date} to {end_date}"
-                )
-                
-                return results
-                
-            except httpx.HTTPStatusError as e:
-                last_error = RateProviderError(
-                    message=f"HTTP error: {e.response.status_code}",
-                    provider=self.PROVIDER_NAME,
-                    error_type=f"HTTP_{e.response.status_code}",
-                    details={"url": str(e.request.url)}
-                )
-                logger.warning(f"Frankfurter bulk HTTP error (attempt {attempt + 1}): {e.response.status_code}")
-                
-            except httpx.TimeoutException as e:
-                last_error = RateProviderError(
-                    message="Request timeout",
-                    provider=self.PROVIDER_NAME,
-                    error_type="TIMEOUT",
-                    details={"timeout_seconds": 120}
-                )
-                logger.warning(f"Frankfurter bulk timeout (attempt {attempt + 1})")
-                
-            except Exception as e:
-                if isinstance(e, RateProviderError):
-                    last_error = e
-                else:
-                    last_error = RateProviderError(
-                        message=str(e),
-                        provider=self.PROVIDER_NAME,
-                        error_type="UNKNOWN",
-                        details={}
-                    )
-                logger.warning(f"Frankfurter bulk error (attempt {attempt + 1}): {e}")
-            
-            # Wait before retry
-            if attempt < max_retries - 1:
-                import asyncio
-                await asyncio.sleep(2 ** attempt)
+        try:
+            results = {
+                date_str: {out: to_dec(day_rates.get(src)) for out, src in codes} | unavailable
+                for date_str, day_rates in data["rates"].items()
+            }
+        except (InvalidOperation, TypeError, ValueError) as e:
+            raise self._error(
+                f"Unparseable rate value: {e}",
+                "PARSE_ERROR",
+                start_date=start_date,
+                end_date=end_date
+            ) from e
         
-        # All retries failed
-        raise last_error
-
+        logger.info(
+            "Frankfurter bulk fetched %s dates: %s to %s",
+            len(results), start_date, end_date
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Frankfurter Decimal conversion cache: %s", _json_number_to_decimal.cache_info())
+        
+        return results
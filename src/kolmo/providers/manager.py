@@ -5,14 +5,17 @@ Provider Manager with Fallback Hierarchy
 🔒 REQ-4.7: Log provider stats to mcol1_provider_stats table
 """
 
+import asyncio
 import logging
 import time
 from datetime import date as date_type
 from decimal import Decimal
 from typing import Literal
 
+from kolmo.config import get_settings
 from kolmo.database import get_connection
 from kolmo.providers.base import BaseRateProvider, RateProviderError
+from kolmo.providers.breaker import get_breaker
 from kolmo.providers.frankfurter import FrankfurterClient
 from kolmo.providers.freecurrencyapi import FreeCurrencyAPIClient
 
@@ -20,6 +23,20 @@ logger = logging.getLogger(__name__)
 
 ProviderName = Literal["frankfurter", "freecurrencyapi"]
 
+# Winning results are reused for this long (today's rates may still be republished)
+RESULT_TTL_SECONDS = 6 * 3600
+
+# Provider stats are written in batches off the fetch path
+STATS_BATCH_SIZE = 100
+STATS_FLUSH_INTERVAL_SECONDS = 0.5
+
+_STATS_INSERT = """
+    INSERT INTO mcol1_provider_stats (
+        date, provider_name, attempt_order, success, 
+        latency_ms, error_type, error_message
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+"""
+
 
 class ProviderManager:
     """
@@ -34,16 +51,78 @@ class ProviderManager:
             ("frankfurter", FrankfurterClient()),
             ("freecurrencyapi", FreeCurrencyAPIClient()),
         ]
+        # date → (rates, provider, fetched_at); concurrent misses share one fetch
+        self._results: dict[str, tuple[dict[str, Decimal], ProviderName, float]] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        # Stats rows are queued and flushed by a lazily started writer task
+        self._stats_queue: asyncio.Queue[tuple | None] = asyncio.Queue()
+        self._stats_writer_task: asyncio.Task | None = None
+    
+    def invalidate(self, date: str) -> None:
+        """Forget the cached winning result for a date (forced recompute)."""
+        self._results.pop(date, None)
     
     async def fetch_with_fallback(
         self,
-        date: str
+        date: str,
+        hedge_delay_ms: int | None = None
+    ) -> tuple[dict[str, Decimal], ProviderName]:
+        """
+        Fetch rates for a date, reusing a recent result when available.
+        
+        Results are kept for RESULT_TTL_SECONDS. Concurrent calls for the
+        same date await a single hedged fetch instead of each hitting the
+        providers (thundering-herd protection).
+        
+        Args:
+            date: ISO 8601 date string (e.g., "2026-01-15")
+            hedge_delay_ms: Hedge delay override (defaults to settings)
+        
+        Returns:
+            Tuple of (rates_dict, provider_name_used)
+        
+        Raises:
+            RuntimeError: If all providers fail
+        """
+        now = time.monotonic()
+        cached = self._results.get(date)
+        if cached is not None and now - cached[2] < RESULT_TTL_SECONDS:
+            return dict(cached[0]), cached[1]
+        
+        future = self._inflight.get(date)
+        if future is None:
+            future = asyncio.ensure_future(self._fetch_hedged(date, hedge_delay_ms))
+            self._inflight[date] = future
+            future.add_done_callback(lambda _: self._inflight.pop(date, None))
+        
+        # Shielded so one cancelled caller does not abort the shared fetch
+        rates, name = await asyncio.shield(future)
+        
+        # Drop expired entries so the map stays bounded
+        self._results = {
+            d: entry for d, entry in self._results.items()
+            if now - entry[2] < RESULT_TTL_SECONDS
+        }
+        self._results[date] = (rates, name, time.monotonic())
+        return dict(rates), name
+    
+    async def _fetch_hedged(
+        self,
+        date: str,
+        hedge_delay_ms: int | None = None
     ) -> tuple[dict[str, Decimal], ProviderName]:
         """
         Attempt providers in order: Frankfurter → CBR → TwelveData.
         
+        Requests are hedged: if a provider has not answered within
+        `hedge_delay_ms`, the next one is started alongside it, and a
+        failure starts the next one immediately. The first successful
+        response wins and the remaining attempts are cancelled. A delay of
+        0 races all providers at once, so an outage costs no extra latency.
+        
         Args:
             date: ISO 8601 date string (e.g., "2026-01-15")
+            hedge_delay_ms: Hedge delay override (defaults to settings)
         
         Returns:
             Tuple of (rates_dict, provider_name_used)
@@ -51,80 +130,125 @@ class ProviderManager:
         Raises:
             RuntimeError: If all providers fail
         """
-        errors: list[RateProviderError] = []
+        if hedge_delay_ms is None:
+            hedge_delay_ms = get_settings().provider_hedge_delay_ms
+        hedge_delay = hedge_delay_ms / 1000
         
-        for idx, (name, client) in enumerate(self.providers, start=1):
-            start_time = time.time()
-            
-            try:
-                logger.info(f"Attempting {name} (attempt {idx}/{len(self.providers)})")
-                
-                rates = await client.fetch_rates(date)
-                
-                latency_ms = int((time.time() - start_time) * 1000)
-                await self._log_stats(
-                    date=date,
-                    provider=name,
-                    attempt_order=idx,
-                    success=True,
-                    latency_ms=latency_ms,
-                    error_type=None,
-                    error_message=None
-                )
-                
-                logger.info(f"✅ {name} success ({latency_ms}ms)")
-                return rates, name
-                
-            except RateProviderError as e:
-                latency_ms = int((time.time() - start_time) * 1000)
-                errors.append(e)
-                
-                await self._log_stats(
-                    date=date,
-                    provider=name,
-                    attempt_order=idx,
-                    success=False,
-                    latency_ms=latency_ms,
-                    error_type=e.error_type,
-                    error_message=str(e)
+        errors: list[tuple[ProviderName, Exception]] = []
+        pending: dict[asyncio.Task, ProviderName] = {}
+        next_idx = 0
+        
+        def launch_next() -> None:
+            nonlocal next_idx
+            name, client = self.providers[next_idx]
+            next_idx += 1
+            task = asyncio.create_task(self._attempt(date, name, client, next_idx))
+            pending[task] = name
+        
+        launch_next()
+        if hedge_delay == 0:
+            while next_idx < len(self.providers):
+                launch_next()
+        try:
+            while pending:
+                more = next_idx < len(self.providers)
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=hedge_delay if more else None,
+                    return_when=asyncio.FIRST_COMPLETED
                 )
                 
-                logger.warning(f"❌ {name} failed: {e}")
+                if not done:
+                    # Hedge: current attempts are slow, start the next provider
+                    launch_next()
+                    continue
                 
-                if idx == len(self.providers):
-                    # Last provider failed - raise aggregated error
-                    raise RuntimeError(
-                        f"All providers failed. Errors: "
-                        f"{[(e.provider, e.error_type) for e in errors]}"
-                    ) from e
+                # Launch order (pending keeps insertion order): primary wins ties
+                for task in [t for t in pending if t in done]:
+                    name = pending.pop(task)
+                    exc = task.exception()
+                    if exc is None:
+                        return task.result(), name
+                    errors.append((name, exc))
                 
-                # Try next provider
-                continue
+                # Fall back immediately instead of waiting out the hedge delay
+                if next_idx < len(self.providers):
+                    launch_next()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        if not errors:
+            raise RuntimeError("No providers available")
+        raise RuntimeError(
+            f"All providers failed. Errors: "
+            f"{[(name, getattr(e, 'error_type', 'UNKNOWN')) for name, e in errors]}"
+        ) from errors[-1][1]
+    
+    async def _attempt(
+        self,
+        date: str,
+        name: ProviderName,
+        client: BaseRateProvider,
+        attempt_order: int
+    ) -> dict[str, Decimal]:
+        """Run one provider fetch and record its outcome in provider stats."""
+        start_time = time.time()
+        
+        try:
+            logger.info("Attempting %s (attempt %s/%s)", name, attempt_order, len(self.providers))
+            async with get_breaker(name):
+                rates = await client.fetch_rates(date)
             
-            except Exception as e:
-                latency_ms = int((time.time() - start_time) * 1000)
-                
-                await self._log_stats(
-                    date=date,
-                    provider=name,
-                    attempt_order=idx,
-                    success=False,
-                    latency_ms=latency_ms,
-                    error_type="UNKNOWN",
-                    error_message=str(e)
-                )
-                
-                logger.error(f"❌ {name} unexpected error: {e}")
-                
-                if idx == len(self.providers):
-                    raise RuntimeError(f"All providers failed. Last error: {e}") from e
-                
-                continue
+        except asyncio.CancelledError:
+            # Lost the hedge race: record the aborted attempt
+            latency_ms = int((time.time() - start_time) * 1000)
+            self._log_stats(
+                date=date,
+                provider=name,
+                attempt_order=attempt_order,
+                success=False,
+                latency_ms=latency_ms,
+                error_type="CANCELLED",
+                error_message="Cancelled: another provider answered first"
+            )
+            logger.info("⏹️ %s cancelled after %sms (hedge lost)", name, latency_ms)
+            raise
+        
+        except Exception as e:
+            latency_ms = int((time.time() - start_time) * 1000)
+            known = isinstance(e, RateProviderError)
+            self._log_stats(
+                date=date,
+                provider=name,
+                attempt_order=attempt_order,
+                success=False,
+                latency_ms=latency_ms,
+                error_type=e.error_type if known else "UNKNOWN",
+                error_message=str(e)
+            )
+            if known:
+                logger.warning("❌ %s failed: %s", name, e)
+            else:
+                logger.error("❌ %s unexpected error: %s", name, e)
+            raise
         
-        # Should not reach here
-        raise RuntimeError("No providers available")
+        latency_ms = int((time.time() - start_time) * 1000)
+        self._log_stats(
+            date=date,
+            provider=name,
+            attempt_order=attempt_order,
+            success=True,
+            latency_ms=latency_ms,
+            error_type=None,
+            error_message=None
+        )
+        logger.info("✅ %s success (%sms)", name, latency_ms)
+        return rates
     
-    async def _log_stats(
+    def _log_stats(
         self,
         date: str,
         provider: ProviderName,
@@ -136,33 +260,68 @@ class ProviderManager:
     ) -> None:
         """
         🔒 REQ-4.7: Log provider stats to mcol1_provider_stats table.
+        
+        Non-blocking: the row is queued and written by the background
+        writer, so DB latency never adds to fetch latency.
         """
+        self._stats_queue.put_nowait((
+            date_type.fromisoformat(date),
+            provider,
+            attempt_order,
+            success,
+            latency_ms,
+            error_type,
+            error_message[:500] if error_message else None
+        ))
+        if self._stats_writer_task is None or self._stats_writer_task.done():
+            self._stats_writer_task = asyncio.create_task(self._stats_writer())
+    
+    async def _stats_writer(self) -> None:
+        """Drain queued stats rows and insert them in batches."""
+        queue = self._stats_queue
+        while True:
+            row = await queue.get()
+            if row is None:
+                return
+            # Let rows from the rest of this fetch accumulate into one batch
+            await asyncio.sleep(STATS_FLUSH_INTERVAL_SECONDS)
+            batch = [row]
+            stop = False
+            while not queue.empty() and len(batch) < STATS_BATCH_SIZE:
+                row = queue.get_nowait()
+                if row is None:
+                    stop = True
+                    break
+                batch.append(row)
+            await self._flush_stats(batch)
+            if stop:
+                return
+    
+    async def _flush_stats(self, batch: list[tuple]) -> None:
         try:
             async with get_connection() as conn:
-                await conn.execute(
-                    """
-                    INSERT INTO mcol1_provider_stats (
-                        date, provider_name, attempt_order, success, 
-                        latency_ms, error_type, error_message
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    """,
-                    date_type.fromisoformat(date),
-                    provider,
-                    attempt_order,
-                    success,
-                    latency_ms,
-                    error_type,
-                    error_message[:500] if error_message else None
-                )
+                await conn.executemany(_STATS_INSERT, batch)
         except Exception as e:
             # Don't fail the main operation if stats logging fails
-            logger.error(f"Failed to log provider stats: {e}")
+            logger.error("Failed to log %s provider stats rows: %s", len(batch), e)
+    
+    async def aclose(self) -> None:
+        """Flush pending provider stats, then close all HTTP clients."""
+        if self._stats_writer_task is not None and not self._stats_writer_task.done():
+            self._stats_queue.put_nowait(None)
+            await self._stats_writer_task
+        results = await asyncio.gather(
+            *(client.aclose() for _, client in self.providers),
+            return_exceptions=True
+        )
+        for (name, _), result in zip(self.providers, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to close %s client: %s", name, result)
     
     async def health_check_all(self) -> dict[ProviderName, bool]:
-        """Check health status of all providers."""
-        results: dict[ProviderName, bool] = {}
-        
-        for name, client in self.providers:
-            results[name] = await client.health_check()
-        
-        return results
+        """Check health status of all providers concurrently (errors count as down)."""
+        statuses = await asyncio.gather(
+            *(client.health_check() for _, client in self.providers),
+            return_exceptions=True
+        )
+        return {name: ok is True for (name, _), ok in zip(self.providers, statuses)}
@@ -0,0 +1,39 @@
+"""
+Общие фикстуры тестов.
+
+Входные данные только для чтения создаются один раз за сессию и
+отдаются как MappingProxyType, чтобы ни один тест не изменил их для остальных.
+"""
+
+from decimal import Decimal
+from types import MappingProxyType
+
+import pytest
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+#  Fixture: тестовые KOLMO-ставки (дата 2026-01-29)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@pytest.fixture(scope="session")
+def rates_20260129():
+    """KOLMO-ставки за 2026-01-29 из kolmo_history.json."""
+    return MappingProxyType({
+        "r_me4u": Decimal("0.143964"),
+        "r_iou2": Decimal("0.835561"),
+        "r_uome": Decimal("8.313200"),
+        "winner": "IOU2",
+    })
+
+
+@pytest.fixture(scope="session")
+def cbr_sample():
+    """Примерные CBR-курсы (RUB за 1 единицу, условные)."""
+    return MappingProxyType({
+        "USD": Decimal("92.5000"),
+        "EUR": Decimal("100.5000"),
+        "CNY": Decimal("12.8000"),
+        "GBP": Decimal("116.0000"),
+        "JPY": Decimal("0.6100"),      # уже нормализованный (за 1 JPY)
+        "CHF": Decimal("105.0000"),
+    })
@@ -0,0 +1,153 @@
+"""
+Circuit Breaker Tests
+
+🔒 REQ-3.1: A failing provider is skipped fail-fast while its circuit is open.
+"""
+
+import asyncio
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import kolmo
+
+
+def _bare_providers_package() -> types.ModuleType:
+    """
+    kolmo.providers without its __init__, which imports every provider
+    client (twelvedata.py is not in this tree). Submodules still load from
+    the real directory.
+    """
+    package = types.ModuleType("kolmo.providers")
+    package.__path__ = [str(Path(kolmo.__file__).parent / "providers")]
+    return package
+
+
+_saved_package = sys.modules.get("kolmo.providers")
+sys.modules["kolmo.providers"] = _saved_package or _bare_providers_package()
+try:
+    import kolmo.providers.breaker as breaker_module
+finally:
+    # Later imports of kolmo.providers must run the real __init__
+    if _saved_package is None:
+        del sys.modules["kolmo.providers"]
+
+CircuitBreaker = breaker_module.CircuitBreaker
+CircuitOpenError = breaker_module.CircuitOpenError
+
+
+class ProviderDown(Exception):
+    pass
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic() for the breaker module."""
+    now = [1000.0]
+    monkeypatch.setattr(breaker_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+async def _fail(breaker: CircuitBreaker) -> None:
+    with pytest.raises(ProviderDown):
+        async with breaker:
+            raise ProviderDown()
+
+
+async def _succeed(breaker: CircuitBreaker) -> None:
+    async with breaker:
+        pass
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+    
+    async def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=3, recovery_timeout=60)
+        
+        await _fail(breaker)
+        await _fail(breaker)
+        assert not breaker.is_open
+        await _fail(breaker)
+        
+        assert breaker.is_open
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await _succeed(breaker)
+        assert exc_info.value.provider == "p"
+    
+    async def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=2)
+        
+        await _fail(breaker)
+        await _succeed(breaker)
+        await _fail(breaker)
+        
+        assert not breaker.is_open
+    
+    async def test_half_open_allows_single_trial(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=60)
+        await _fail(breaker)
+        clock[0] += 60
+        
+        async with breaker:
+            # Trial in flight: concurrent calls are still rejected
+            with pytest.raises(CircuitOpenError):
+                await _succeed(breaker)
+    
+    async def test_trial_success_closes(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=60)
+        await _fail(breaker)
+        clock[0] += 60
+        
+        await _succeed(breaker)
+        
+        assert not breaker.is_open
+        await _succeed(breaker)
+    
+    async def test_trial_failure_reopens(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=3, recovery_timeout=60)
+        for _ in range(3):
+            await _fail(breaker)
+        clock[0] += 60
+        
+        await _fail(breaker)
+        
+        # A single trial failure re-opens with a fresh cooldown
+        assert breaker.is_open
+        clock[0] += 59
+        with pytest.raises(CircuitOpenError):
+            await _succeed(breaker)
+    
+    async def test_cancellation_is_not_a_fault(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=60)
+        
+        with pytest.raises(asyncio.CancelledError):
+            async with breaker:
+                raise asyncio.CancelledError()
+        
+        assert breaker.failures == 0
+        assert not breaker.is_open
+    
+    async def test_cancelled_trial_frees_half_open_slot(self, clock):
+        breaker = CircuitBreaker("p", failure_threshold=1, recovery_timeout=60)
+        await _fail(breaker)
+        clock[0] += 60
+        
+        with pytest.raises(asyncio.CancelledError):
+            async with breaker:
+                raise asyncio.CancelledError()
+        
+        # Still open, but the next call may run the trial
+        assert breaker.is_open
+        await _succeed(breaker)
+        assert not breaker.is_open
+    
+    def test_get_breaker_is_process_wide(self, monkeypatch):
+        monkeypatch.setattr(breaker_module, "_BREAKERS", {})
+        
+        breaker = breaker_module.get_breaker("p")
+        
+        assert breaker_module.get_breaker("p") is breaker
+        assert breaker_module.get_breaker("q") is not breaker
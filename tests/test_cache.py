@@ -0,0 +1,218 @@
+"""
+Rates Cache Tests
+
+🔒 REQ-2.1: Cached rates round-trip as exact Decimals.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from kolmo import cache
+from kolmo.cache import DiskCache, LRUCache
+
+
+RATES = {"eur_usd": Decimal("1.163000000000000000001"), "eur_cny": None}
+
+
+def _day(days_ago: int) -> str:
+    return (date.today() - timedelta(days=days_ago)).isoformat()
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    """Isolated memory tier, disk tier disabled unless a test enables it."""
+    monkeypatch.setattr(cache, "rates_cache", LRUCache())
+    monkeypatch.setattr(cache, "_disk_cache", lambda: None)
+
+
+@pytest.fixture
+def disk(monkeypatch, tmp_path):
+    """Enable the disk tier under tmp_path."""
+    disk_cache = DiskCache(tmp_path)
+    monkeypatch.setattr(cache, "_disk_cache", lambda: disk_cache)
+    return disk_cache
+
+
+class TestLRUCache:
+    """Tests for LRUCache."""
+    
+    async def test_get_missing(self):
+        assert await LRUCache().get("k") is None
+    
+    async def test_entry_expires(self, monkeypatch):
+        lru = LRUCache()
+        now = 1000.0
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+        
+        await lru.set("k", "v", ex=10)
+        assert await lru.get("k") == "v"
+        
+        now = 1010.0
+        assert await lru.get("k") is None
+        assert lru.keys() == []
+    
+    async def test_entry_without_ttl_never_expires(self, monkeypatch):
+        lru = LRUCache()
+        now = 0.0
+        monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+        
+        await lru.set("k", "v")
+        now = 1e12
+        
+        assert await lru.get("k") == "v"
+    
+    async def test_evicts_least_recently_used(self):
+        lru = LRUCache(maxsize=2)
+        await lru.set("a", "1")
+        await lru.set("b", "2")
+        await lru.get("a")  # "b" is now least recently used
+        
+        await lru.set("c", "3")
+        
+        assert lru.keys() == ["a", "c"]
+        assert await lru.get("b") is None
+    
+    async def test_delete_and_clear(self):
+        lru = LRUCache()
+        await lru.set("a", "1")
+        await lru.set("b", "2")
+        
+        await lru.delete("a")
+        await lru.delete("missing")
+        assert lru.keys() == ["b"]
+        
+        lru.clear()
+        assert lru.keys() == []
+
+
+class TestDiskCache:
+    """Tests for DiskCache."""
+    
+    async def test_roundtrip(self, tmp_path):
+        disk = DiskCache(tmp_path)
+        
+        await disk.set("frankfurter:2026-01-02", '{"a":"1"}')
+        
+        assert await disk.get("frankfurter:2026-01-02") == '{"a":"1"}'
+        assert (tmp_path / "frankfurter" / "2026-01-02.json").is_file()
+        assert list(tmp_path.rglob("*.tmp")) == []
+    
+    async def test_get_missing(self, tmp_path):
+        assert await DiskCache(tmp_path).get("frankfurter:2026-01-02") is None
+    
+    async def test_delete_day_all_providers(self, tmp_path):
+        disk = DiskCache(tmp_path)
+        await disk.set("frankfurter:2026-01-02", "{}")
+        await disk.set("cbr:2026-01-02", "{}")
+        await disk.set("cbr:2026-01-03", "{}")
+        
+        await disk.delete_day("2026-01-02")
+        
+        assert await disk.get("frankfurter:2026-01-02") is None
+        assert await disk.get("cbr:2026-01-02") is None
+        assert await disk.get("cbr:2026-01-03") == "{}"
+
+
+class TestCachedRates:
+    """Tests for get_cached_rates / store_cached_rates / invalidate."""
+    
+    async def test_roundtrip_keeps_decimal_exact(self):
+        await cache.store_cached_rates("frankfurter", _day(1), RATES)
+        
+        cached = await cache.get_cached_rates("frankfurter", _day(1))
+        
+        assert cached == RATES
+        assert str(cached["eur_usd"]) == "1.163000000000000000001"
+    
+    @pytest.mark.parametrize("days_ago", [0, -1])
+    async def test_today_and_future_never_cached(self, disk, days_ago):
+        await cache.store_cached_rates("frankfurter", _day(days_ago), RATES)
+        
+        assert cache.rates_cache.keys() == []
+        assert await disk.get(f"frankfurter:{_day(days_ago)}") is None
+        assert await cache.get_cached_rates("frankfurter", _day(days_ago)) is None
+    
+    async def test_recent_day_memory_only(self, disk):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS - 1)
+        
+        await cache.store_cached_rates("frankfurter", day, RATES)
+        
+        assert cache.rates_cache.keys() == [f"frankfurter:{day}"]
+        assert await disk.get(f"frankfurter:{day}") is None
+    
+    async def test_final_day_written_to_disk(self, disk):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        
+        await cache.store_cached_rates("frankfurter", day, RATES)
+        
+        assert await disk.get(f"frankfurter:{day}") is not None
+    
+    async def test_disk_hit_repopulates_memory(self, disk):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        await cache.store_cached_rates("frankfurter", day, RATES)
+        cache.rates_cache.clear()
+        
+        assert await cache.get_cached_rates("frankfurter", day) == RATES
+        assert cache.rates_cache.keys() == [f"frankfurter:{day}"]
+    
+    async def test_recent_day_not_read_from_disk(self, disk):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS - 1)
+        await disk.set(f"frankfurter:{day}", '{"eur_usd":"1.1"}')
+        
+        assert await cache.get_cached_rates("frankfurter", day) is None
+    
+    async def test_invalidate_drops_day_for_all_providers(self, disk):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        other = _day(cache.DISK_CACHE_MIN_AGE_DAYS + 1)
+        for provider in ("frankfurter", "cbr"):
+            await cache.store_cached_rates(provider, day, RATES)
+        await cache.store_cached_rates("cbr", other, RATES)
+        
+        await cache.invalidate(day)
+        
+        assert cache.rates_cache.keys() == [f"cbr:{other}"]
+        assert await cache.get_cached_rates("frankfurter", day) is None
+        assert await cache.get_cached_rates("cbr", day) is None
+        assert await cache.get_cached_rates("cbr", other) == RATES
+
+
+class TestCacheFailures:
+    """A broken cache tier is a miss, never an error."""
+    
+    @pytest.mark.parametrize("content", ["{not json", '["eur_usd"]', '{"eur_usd":"1.1.1"}'])
+    async def test_corrupt_disk_entry_is_dropped(self, disk, content):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        key = f"frankfurter:{day}"
+        await disk.set(key, content)
+        
+        assert await cache.get_cached_rates("frankfurter", day) is None
+        assert await disk.get(key) is None
+        assert cache.rates_cache.keys() == []
+    
+    async def test_unreadable_disk_entry_is_a_miss(self, disk, tmp_path):
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        # A directory where the file should be: read_text() raises IsADirectoryError
+        (tmp_path / "frankfurter" / f"{day}.json").mkdir(parents=True)
+        
+        assert await cache.get_cached_rates("frankfurter", day) is None
+    
+    async def test_unwritable_directory_keeps_memory_tier(self, monkeypatch, tmp_path):
+        (tmp_path / "file").write_text("")
+        monkeypatch.setattr(cache, "_disk_cache", lambda: DiskCache(tmp_path / "file" / "cache"))
+        day = _day(cache.DISK_CACHE_MIN_AGE_DAYS)
+        
+        await cache.store_cached_rates("frankfurter", day, RATES)
+        await cache.invalidate(_day(cache.DISK_CACHE_MIN_AGE_DAYS + 1))
+        
+        assert await cache.get_cached_rates("frankfurter", day) == RATES
+    
+    async def test_store_failure_is_swallowed(self, monkeypatch):
+        async def broken_set(key, value, ex=None):
+            raise OSError("no space left on device")
+        monkeypatch.setattr(cache.rates_cache, "set", broken_set)
+        
+        await cache.store_cached_rates("frankfurter", _day(1), RATES)
+        
+        assert await cache.get_cached_rates("frankfurter", _day(1)) is None
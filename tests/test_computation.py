@@ -10,15 +10,22 @@ from decimal import Decimal
 
 from kolmo.computation.transformer import RateTransformer
 from kolmo.computation.calculator import KOLMOCalculator
+from kolmo.computation.engine import encode_sources
 from kolmo.computation.winner import WinnerSelector
 from kolmo.models import KolmoRates, KolmoState, WinnerCoin, SelectionRule
 
 
+_ONE = Decimal("1")
+_TOL_K = Decimal("0.05")
+_TOL_DIM = Decimal("1e-6")
+
+
 class TestRateTransformer:
     """Tests for RateTransformer."""
     
-    def setup_method(self):
-        self.transformer = RateTransformer()
+    @classmethod
+    def setup_class(cls):
+        cls.transformer = RateTransformer()
     
     def test_transform_basic(self):
         """Test basic rate transformation."""
@@ -53,9 +60,9 @@ class TestRateTransformer:
         
         # Product should be close to 1.0
         product = rates.r_me4u * rates.r_iou2 * rates.r_uome
-        deviation = abs(product - Decimal("1.0"))
+        deviation = abs(product - _ONE)
         
-        assert deviation < Decimal("0.05"), f"Dimensional analysis failed: K={product}"
+        assert deviation < _TOL_K, f"Dimensional analysis failed: K={product}"
     
     def test_transform_invalid_dimensional_analysis_fails(self):
         """
@@ -82,15 +89,16 @@ class TestRateTransformer:
             rates = transformer.transform(eur_usd=eur_usd, eur_cny=eur_cny)
             kolmo_value = rates.r_me4u * rates.r_iou2 * rates.r_uome
             # Due to formula design, K should always equal 1.0
-            assert abs(kolmo_value - Decimal("1.0")) < Decimal("0.000001"), \
+            assert abs(kolmo_value - _ONE) < _TOL_DIM, \
                 f"Dimensional analysis failed for eur_usd={eur_usd}, eur_cny={eur_cny}: K={kolmo_value}"
 
 
 class TestKOLMOCalculator:
     """Tests for KOLMOCalculator."""
     
-    def setup_method(self):
-        self.calculator = KOLMOCalculator()
+    @classmethod
+    def setup_class(cls):
+        cls.calculator = KOLMOCalculator()
     
     def test_compute_kolmo_value_exact(self):
         """🔒 Amendment A1: Verify EXACT KOLMO computation."""
@@ -199,8 +207,9 @@ class TestKOLMOCalculator:
 class TestWinnerSelector:
     """Tests for WinnerSelector."""
     
-    def setup_method(self):
-        self.selector = WinnerSelector()
+    @classmethod
+    def setup_class(cls):
+        cls.selector = WinnerSelector()
     
     def test_select_highest_positive(self):
         """🔒 REQ-2.5: Select coin with highest positive RelativePath."""
@@ -236,6 +245,52 @@ class TestWinnerSelector:
         assert "IOU2" in reason.tied_coins
         assert "ME4U" in reason.tied_coins
     
+    def test_select_near_tie_strict_win(self):
+        """🔒 REQ-2.5: A strictly higher Decimal relpath wins, however close."""
+        winner, reason = self.selector.select(
+            Decimal("5.0000000000001"),
+            Decimal("5"),
+            None
+        )
+        
+        assert winner == WinnerCoin.ME4U
+        assert reason.tied_coins == ["ME4U"]
+    
+    def test_select_near_tie_below_float_resolution(self):
+        """🔒 REQ-2.5: Values equal as floats are still ranked exactly."""
+        winner, reason = self.selector.select(
+            Decimal("1.0000000000000000000000001"),
+            Decimal("1"),
+            Decimal("1")
+        )
+        
+        assert winner == WinnerCoin.ME4U
+        assert reason.tied_coins == ["ME4U"]
+    
+    def test_select_near_zero_positive(self):
+        """🔒 REQ-2.5: A tiny positive relpath beats zero and is positive."""
+        winner, reason = self.selector.select(
+            Decimal("1E-13"),
+            Decimal("0"),
+            Decimal("-1")
+        )
+        
+        assert winner == WinnerCoin.ME4U
+        assert reason.tied_coins == ["ME4U"]
+        assert reason.selection_rule == SelectionRule.MAX_POSITIVE_ALPHABETICAL_TIEBREAK
+    
+    def test_select_zero_is_not_positive(self):
+        """🔒 REQ-2.5: A zero maximum falls under the least-negative rule."""
+        winner, reason = self.selector.select(
+            Decimal("0"),
+            Decimal("-1E-30"),
+            Decimal("-1")
+        )
+        
+        assert winner == WinnerCoin.ME4U
+        assert reason.tied_coins == ["ME4U"]
+        assert reason.selection_rule == SelectionRule.LEAST_NEGATIVE
+    
     def test_select_all_null_first_day(self):
         """🔒 REQ-5.7: Default to IOU2 when all NULL."""
         winner, reason = self.selector.select(None, None, None)
@@ -317,3 +372,30 @@ class TestKolmoIntegration:
             Decimal("1.00")
         )
         assert winner == WinnerCoin.IOU2  # Alphabetical: IOU2 < ME4U
+
+
+class TestEncodeSources:
+    """Tests for encode_sources (JSONB audit column)."""
+    
+    def test_encodes_with_orjson(self):
+        raw = encode_sources({"eur_usd": "1.163", "provider": "frankfurter", "n": 2, "ok": None})
+        
+        assert raw == '{"eur_usd":"1.163","provider":"frankfurter","n":2,"ok":null}'
+    
+    def test_rejects_float(self):
+        with pytest.raises(TypeError, match="float"):
+            encode_sources({"eur_usd": 1.163})
+    
+    @pytest.mark.parametrize("sources", [
+        {"a": {"b": 1.5}},
+        {"c": [2.5]},
+        {"d": [{"e": (1, 3.5)}]},
+    ])
+    def test_rejects_nested_float(self, sources):
+        with pytest.raises(TypeError, match="float"):
+            encode_sources(sources)
+    
+    def test_rejects_decimal(self):
+        """Decimals must be passed as str so the stored text is exact."""
+        with pytest.raises(TypeError, match="Decimal"):
+            encode_sources({"eur_usd": Decimal("1.163")})
@@ -0,0 +1,76 @@
+"""
+JSON Export Tests
+
+🔒 REQ-6.1: Daily and history JSON exports must agree for the same date.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from kolmo.export.json_exporter import _format_deviation, _history_row_from_csv
+
+
+class TestFormatDeviation:
+    """Python formatting of kolmo_deviation must match the SQL to_char() output."""
+    
+    def test_rounds_to_column_scale_before_scaling(self):
+        """NUMERIC(28, 18) keeps 18 decimals; digits beyond never reach the file."""
+        assert _format_deviation(Decimal("-0.00022821773986000000178")) == \
+            "-22.821773986000000000e-5"
+    
+    def test_rounds_half_away_from_zero(self):
+        assert _format_deviation(Decimal("0.0000000000000000015")) == \
+            "0.000000000000200000e-5"
+        assert _format_deviation(Decimal("-0.0000000000000000015")) == \
+            "-0.000000000000200000e-5"
+    
+    def test_fixed_point_with_18_decimals(self):
+        assert _format_deviation(Decimal("0.0041")) == "410.000000000000000000e-5"
+    
+    def test_zero_has_no_sign(self):
+        assert _format_deviation(Decimal("-0E-30")) == "0.000000000000000000e-5"
+
+
+class TestHistoryRowFromCsv:
+    """COPY csv lines must produce the same record as the Decimal-based export."""
+    
+    def test_passes_rates_through_as_text(self):
+        row = _history_row_from_csv([
+            "2026-01-29", "0.143964", "0.835561", "8.313200",
+            "0.0012", "-0.0034", "0.0056",
+            "0.01", "0.02", "0.03",
+            "IOU2", "-22.821773986000000000e-5",
+        ])
+        
+        assert row == {
+            "date": "2026-01-29",
+            "r_me4u": "0.143964",
+            "r_iou2": "0.835561",
+            "r_uome": "8.313200",
+            "relpath_me4u": 0.0012,
+            "relpath_iou2": -0.0034,
+            "relpath_uome": 0.0056,
+            "vol_me4u": 0.01,
+            "vol_iou2": 0.02,
+            "vol_uome": 0.03,
+            "winner": "IOU2",
+            "kolmo_deviation": "-22.821773986000000000e-5",
+        }
+        assert row["r_uome"] == str(Decimal("8.313200"))
+    
+    def test_empty_fields_are_null(self):
+        row = _history_row_from_csv([
+            "2026-01-29", "0.143964", "0.835561", "8.313200",
+            "", "", "",
+            "", "", "",
+            "ME4U", "0.000000000000000000e-5",
+        ])
+        
+        for key in ("relpath_me4u", "relpath_iou2", "relpath_uome",
+                    "vol_me4u", "vol_iou2", "vol_uome"):
+            assert row[key] is None
+    
+    def test_rejects_wrong_column_count(self):
+        with pytest.raises(ValueError):
+            _history_row_from_csv(["2026-01-29", "0.143964"])
@@ -7,6 +7,8 @@ Golden Dataset Tests
 
 import csv
 import os
+from collections import namedtuple
+
 import pytest
 from decimal import Decimal
 from pathlib import Path
@@ -19,30 +21,72 @@ from kolmo.computation.winner import WinnerSelector
 # Path to golden dataset
 GOLDEN_DATA_PATH = Path(__file__).parent / "golden" / "kolmo_reference_data.csv"
 
+_TOL_DIST = Decimal("0.0001")
+
+
+GoldenRow = namedtuple(
+    "GoldenRow",
+    "date eur_usd eur_cny r_me4u r_iou2 r_uome kolmo_value_exact "
+    "dist_me4u dist_iou2 dist_uome relpath_me4u relpath_iou2 relpath_uome winner"
+)
+
+
+def _parse_optional_decimal(value: str | None) -> Decimal | None:
+    """RelativePath columns are empty on the first day."""
+    return Decimal(value) if value else None
+
+
+def _load_and_parse() -> list[GoldenRow]:
+    """Read the CSV once, converting every numeric column to Decimal."""
+    with open(GOLDEN_DATA_PATH, newline="") as f:
+        return [
+            GoldenRow(
+                date=row["date"],
+                eur_usd=Decimal(row["eur_usd"]),
+                eur_cny=Decimal(row["eur_cny"]),
+                r_me4u=Decimal(row["r_me4u"]),
+                r_iou2=Decimal(row["r_iou2"]),
+                r_uome=Decimal(row["r_uome"]),
+                kolmo_value_exact=Decimal(row["kolmo_value_exact"]),
+                dist_me4u=Decimal(row["dist_me4u"]),
+                dist_iou2=Decimal(row["dist_iou2"]),
+                dist_uome=Decimal(row["dist_uome"]),
+                relpath_me4u=_parse_optional_decimal(row.get("relpath_me4u")),
+                relpath_iou2=_parse_optional_decimal(row.get("relpath_iou2")),
+                relpath_uome=_parse_optional_decimal(row.get("relpath_uome")),
+                winner=row["winner"],
+            )
+            for row in csv.DictReader(f)
+        ]
 
-def load_golden_data():
+
+# Parsed at collection time so per-row tests can be parametrized by date
+_GOLDEN = _load_and_parse() if GOLDEN_DATA_PATH.exists() else []
+_GOLDEN_IDS = [row.date for row in _GOLDEN]
+
+
+def load_golden_data() -> list[GoldenRow]:
     """Load golden dataset if it exists."""
     if not GOLDEN_DATA_PATH.exists():
         pytest.skip(f"Golden dataset not found at {GOLDEN_DATA_PATH}")
     
-    with open(GOLDEN_DATA_PATH, newline="") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    return _GOLDEN
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def golden_data():
-    """Fixture to load golden dataset."""
+    """Golden dataset, parsed once per test session."""
     return load_golden_data()
 
 
 class TestGoldenDataset:
     """Tests against golden reference dataset."""
     
-    def setup_method(self):
-        self.transformer = RateTransformer()
-        self.calculator = KOLMOCalculator()
-        self.selector = WinnerSelector()
+    @classmethod
+    def setup_class(cls):
+        cls.transformer = RateTransformer()
+        cls.calculator = KOLMOCalculator()
+        cls.selector = WinnerSelector()
     
     @pytest.mark.skipif(
         not GOLDEN_DATA_PATH.exists(),
@@ -65,82 +109,56 @@ class TestGoldenDataset:
         not GOLDEN_DATA_PATH.exists(),
         reason="Golden dataset not available"
     )
-    def test_golden_kolmo_exact_match(self, golden_data):
+    @pytest.mark.parametrize("row", _GOLDEN, ids=_GOLDEN_IDS)
+    def test_golden_kolmo_exact_match(self, row):
         """
         🔒 REQ-8.5: KOLMO calculation MUST match golden dataset exactly.
         
         Verifies that kolmo_value = r_me4u * r_iou2 * r_uome
         matches the kolmo_value_exact column (exact string match).
         """
-        for row in golden_data:
-            date = row["date"]
-            
-            r_me4u = Decimal(row["r_me4u"])
-            r_iou2 = Decimal(row["r_iou2"])
-            r_uome = Decimal(row["r_uome"])
-            
-            computed_kolmo = self.calculator.compute_kolmo_value(
-                r_me4u, r_iou2, r_uome
-            )
-            
-            expected_kolmo = Decimal(row["kolmo_value_exact"])
-            
-            assert computed_kolmo == expected_kolmo, \
-                f"Date {date}: KOLMO mismatch. " \
-                f"Computed: {computed_kolmo}, Expected: {expected_kolmo}"
+        computed_kolmo = self.calculator.compute_kolmo_value(
+            row.r_me4u, row.r_iou2, row.r_uome
+        )
+        
+        assert computed_kolmo == row.kolmo_value_exact, \
+            f"Date {row.date}: KOLMO mismatch. " \
+            f"Computed: {computed_kolmo}, Expected: {row.kolmo_value_exact}"
     
     @pytest.mark.skipif(
         not GOLDEN_DATA_PATH.exists(),
         reason="Golden dataset not available"
     )
-    def test_golden_winner_match(self, golden_data):
+    @pytest.mark.parametrize("row", _GOLDEN, ids=_GOLDEN_IDS)
+    def test_golden_winner_match(self, row):
         """
         🔒 REQ-8.5: Winner selection MUST match golden dataset exactly.
         """
-        for row in golden_data:
-            date = row["date"]
-            expected_winner = row["winner"]
-            
-            # Parse RelativePath values (may be empty string for first day)
-            relpath_me4u = Decimal(row["relpath_me4u"]) if row.get("relpath_me4u") else None
-            relpath_iou2 = Decimal(row["relpath_iou2"]) if row.get("relpath_iou2") else None
-            relpath_uome = Decimal(row["relpath_uome"]) if row.get("relpath_uome") else None
-            
-            winner, _ = self.selector.select(relpath_me4u, relpath_iou2, relpath_uome)
-            
-            assert winner.value == expected_winner, \
-                f"Date {date}: Winner mismatch. " \
-                f"Computed: {winner.value}, Expected: {expected_winner}"
+        winner, _ = self.selector.select(
+            row.relpath_me4u, row.relpath_iou2, row.relpath_uome
+        )
+        
+        assert winner.value == row.winner, \
+            f"Date {row.date}: Winner mismatch. " \
+            f"Computed: {winner.value}, Expected: {row.winner}"
     
     @pytest.mark.skipif(
         not GOLDEN_DATA_PATH.exists(),
         reason="Golden dataset not available"
     )
-    def test_golden_distance_calculation(self, golden_data):
+    @pytest.mark.parametrize("row", _GOLDEN, ids=_GOLDEN_IDS)
+    def test_golden_distance_calculation(self, row):
         """Verify distance calculations match golden dataset (±0.0001 tolerance)."""
-        for row in golden_data:
-            date = row["date"]
-            
-            r_me4u = Decimal(row["r_me4u"])
-            r_iou2 = Decimal(row["r_iou2"])
-            r_uome = Decimal(row["r_uome"])
-            
-            computed_dist_me4u = self.calculator.compute_distance(r_me4u)
-            computed_dist_iou2 = self.calculator.compute_distance(r_iou2)
-            computed_dist_uome = self.calculator.compute_distance(r_uome)
-            
-            expected_dist_me4u = Decimal(row["dist_me4u"])
-            expected_dist_iou2 = Decimal(row["dist_iou2"])
-            expected_dist_uome = Decimal(row["dist_uome"])
-            
-            tolerance = Decimal("0.0001")
-            
-            assert abs(computed_dist_me4u - expected_dist_me4u) < tolerance, \
-                f"Date {date}: dist_me4u mismatch"
-            assert abs(computed_dist_iou2 - expected_dist_iou2) < tolerance, \
-                f"Date {date}: dist_iou2 mismatch"
-            assert abs(computed_dist_uome - expected_dist_uome) < tolerance, \
-                f"Date {date}: dist_uome mismatch"
+        computed_dist_me4u = self.calculator.compute_distance(row.r_me4u)
+        computed_dist_iou2 = self.calculator.compute_distance(row.r_iou2)
+        computed_dist_uome = self.calculator.compute_distance(row.r_uome)
+        
+        assert abs(computed_dist_me4u - row.dist_me4u) < _TOL_DIST, \
+            f"Date {row.date}: dist_me4u mismatch"
+        assert abs(computed_dist_iou2 - row.dist_iou2) < _TOL_DIST, \
+            f"Date {row.date}: dist_iou2 mismatch"
+        assert abs(computed_dist_uome - row.dist_uome) < _TOL_DIST, \
+            f"Date {row.date}: dist_uome mismatch"
 
 
 class TestGoldenDatasetEndToEnd:
@@ -159,6 +177,9 @@ class TestGoldenDatasetEndToEnd:
         2. Compute KOLMO
         3. Compute distances
         4. Select winner
+        
+        Kept as a single sequential test: each day's RelativePath depends
+        on the previous day's computed distances.
         """
         transformer = RateTransformer()
         calculator = KOLMOCalculator()
@@ -167,12 +188,8 @@ class TestGoldenDatasetEndToEnd:
         prev_distances = {}
         
         for row in golden_data:
-            date = row["date"]
-            eur_usd = Decimal(row["eur_usd"])
-            eur_cny = Decimal(row["eur_cny"])
-            
             # Step 1: Transform
-            rates = transformer.transform(eur_usd, eur_cny)
+            rates = transformer.transform(row.eur_usd, row.eur_cny)
             
             # Step 2: KOLMO
             kolmo = calculator.compute_kolmo_value(
@@ -199,9 +216,8 @@ class TestGoldenDatasetEndToEnd:
             winner, _ = selector.select(relpath_me4u, relpath_iou2, relpath_uome)
             
             # Verify winner matches
-            expected_winner = row["winner"]
-            assert winner.value == expected_winner, \
-                f"Date {date}: Pipeline winner mismatch"
+            assert winner.value == row.winner, \
+                f"Date {row.date}: Pipeline winner mismatch"
             
             # Update prev_distances for next iteration
             prev_distances = {
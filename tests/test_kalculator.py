@@ -12,23 +12,42 @@
 """
 
 import json
-import sys
-from decimal import Decimal, getcontext
-from pathlib import Path
+from decimal import ROUND_HALF_EVEN, Context, Decimal, localcontext
+from enum import Enum
 
 import pytest
 
-# Decimal precision, как в kalculator.py
-getcontext().prec = 28
-
-# Подключаем kalculator.py из scripts/
-SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
-sys.path.insert(0, str(SCRIPTS_DIR))
-
-import kalculator as kal  # noqa: E402
+# kalculator.py из scripts/ (путь задан в pythonpath в pyproject.toml)
+import kalculator as kal
 
 ONE = Decimal("1")
 
+# Decimal-контекст, как в kalculator.py; глобальный контекст тест не трогает
+_CTX = Context(prec=28, rounding=ROUND_HALF_EVEN)
+
+# Взаимно обратные пары winner_to_winner
+W2W_INVERSE_PAIRS = [
+    ("ME4U_IOU2", "IOU2_ME4U"),
+    ("ME4U_UOME", "UOME_ME4U"),
+    ("IOU2_UOME", "UOME_IOU2"),
+]
+
+# Пары fiat_to_winner[X_COIN] ↔ winner_to_fiat[COIN_X]
+INVERSE_PAIRS = [
+    ("CNY_ME4U", "ME4U_CNY"),
+    ("USD_ME4U", "ME4U_USD"),
+    ("EUR_ME4U", "ME4U_EUR"),
+    ("USD_IOU2", "IOU2_USD"),
+    ("EUR_IOU2", "IOU2_EUR"),
+    ("CNY_IOU2", "IOU2_CNY"),
+    ("EUR_UOME", "UOME_EUR"),
+    ("USD_UOME", "UOME_USD"),
+    ("CNY_UOME", "UOME_CNY"),
+]
+
+# Валюты фикстуры cbr_sample
+CBR_CODES = ["USD", "EUR", "CNY", "GBP", "JPY", "CHF"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #  Helpers
@@ -38,37 +57,68 @@ def _dec(s: str) -> Decimal:
     return Decimal(s)
 
 
-def assert_close(a: Decimal, b: Decimal, tol: str = "1E-15") -> None:
-    """Проверка приближённого равенства Decimal."""
-    assert abs(a - b) < Decimal(tol), f"{a} ≠ {b} (±{tol})"
+class Tol(Enum):
+    """Допуски assert_close, разобранные один раз при импорте."""
+
+    TIGHT = Decimal("1E-15")
+    LOOSE = Decimal("0.001")
+
+
+def assert_close(a: Decimal, b: Decimal, tol: Tol = Tol.TIGHT) -> None:
+    """
+    Проверка приближённого равенства Decimal.
+
+    pytest.approx сравнивает Decimal без перевода во float и при ошибке
+    показывает полученное и ожидаемое значение с допуском.
+    """
+    with localcontext(_CTX):
+        assert a == pytest.approx(b, rel=0, abs=tol.value)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-#  Fixture: тестовые KOLMO-ставки (дата 2026-01-29)
+#  Fixtures: блоки коэффициентов за 2026-01-29 (считаются один раз)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@pytest.fixture
-def rates_20260129():
-    """KOLMO-ставки за 2026-01-29 из kolmo_history.json."""
-    return {
-        "r_me4u": _dec("0.143964"),
-        "r_iou2": _dec("0.835561"),
-        "r_uome": _dec("8.313200"),
-        "winner": "IOU2",
-    }
-
-
-@pytest.fixture
-def cbr_sample():
-    """Примерные CBR-курсы (RUB за 1 единицу, условные)."""
-    return {
-        "USD": _dec("92.5000"),
-        "EUR": _dec("100.5000"),
-        "CNY": _dec("12.8000"),
-        "GBP": _dec("116.0000"),
-        "JPY": _dec("0.6100"),      # уже нормализованный (за 1 JPY)
-        "CHF": _dec("105.0000"),
-    }
+@pytest.fixture(scope="session")
+def w2w(rates_20260129):
+    r = rates_20260129
+    return kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
+
+
+@pytest.fixture(scope="session")
+def f2w(rates_20260129):
+    r = rates_20260129
+    return kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
+
+
+@pytest.fixture(scope="session")
+def w2f(rates_20260129):
+    r = rates_20260129
+    return kal.compute_winner_to_fiat(r["r_me4u"], r["r_iou2"], r["r_uome"])
+
+
+@pytest.fixture(scope="session")
+def rub_blocks(rates_20260129, cbr_sample):
+    r = rates_20260129
+    return kal.compute_rub_winner(
+        r["r_me4u"], r["r_iou2"], r["r_uome"],
+        cbr_sample["USD"], cbr_sample["EUR"], cbr_sample["CNY"],
+    )
+
+
+@pytest.fixture(scope="session")
+def cbr_blocks(cbr_sample):
+    return kal.compute_cbr_to_winner("IOU2", cbr_sample)
+
+
+@pytest.fixture(scope="session")
+def cbr_nominals():
+    return kal._cbr_nominals()
+
+
+@pytest.fixture(scope="session")
+def day_result(rates_20260129, cbr_sample):
+    return kal.compute_day("2026-01-29", rates_20260129, cbr_sample)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -89,9 +139,15 @@ class TestDecimalHelpers:
         s = kal._serialize(d)
         assert "E" not in s and "e" not in s
 
-    def test_serialize_18_decimals(self):
-        d = _dec("0.143964")
-        s = kal._serialize(d)
+    @pytest.mark.parametrize("raw", [
+        "0.143964",
+        "6.788634127999999102E-5",
+        "1",
+        "0.000000000000000001",
+        "8.313200",
+    ])
+    def test_serialize_18_decimals(self, raw):
+        s = kal._serialize(_dec(raw))
         # Должно быть ровно 18 знаков после точки
         integer_part, frac_part = s.split(".")
         assert len(frac_part) == 18
@@ -103,36 +159,29 @@ class TestDecimalHelpers:
 
 class TestWinnerToWinner:
 
-    def test_inverse_pairs(self, rates_20260129):
-        r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-
-        # ME4U_IOU2 × IOU2_ME4U = 1
-        assert_close(w2w["ME4U_IOU2"] * w2w["IOU2_ME4U"], ONE)
-        # ME4U_UOME × UOME_ME4U = 1
-        assert_close(w2w["ME4U_UOME"] * w2w["UOME_ME4U"], ONE)
-        # IOU2_UOME × UOME_IOU2 = 1
-        assert_close(w2w["IOU2_UOME"] * w2w["UOME_IOU2"], ONE)
+    def test_inverse_pairs(self, w2w):
+        """A_B × B_A = 1 для всех пар; при ошибке выводятся все отклонения."""
+        diffs = {
+            f"{a}×{b}": abs(w2w[a] * w2w[b] - ONE)
+            for a, b in W2W_INVERSE_PAIRS
+        }
+        assert max(diffs.values()) < Tol.TIGHT.value, diffs
 
-    def test_me4u_iou2_value(self, rates_20260129):
+    def test_me4u_iou2_value(self, rates_20260129, w2w):
         """ME4U→IOU2 = r_me4u (1 CNY → r_me4u USD)."""
         r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         assert w2w["ME4U_IOU2"] == r["r_me4u"]
 
-    def test_iou2_uome_value(self, rates_20260129):
+    def test_iou2_uome_value(self, rates_20260129, w2w):
         """IOU2→UOME = r_iou2 (1 USD → r_iou2 EUR)."""
         r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         assert w2w["IOU2_UOME"] == r["r_iou2"]
 
-    def test_triangle_consistency(self, rates_20260129):
+    def test_triangle_consistency(self, w2w):
         """ME4U→IOU2→UOME→ME4U ≈ 1 (по KOLMO-инварианту)."""
-        r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         cycle = w2w["ME4U_IOU2"] * w2w["IOU2_UOME"] * w2w["UOME_ME4U"]
         # Это = r_me4u × r_iou2 × r_uome = KOLMO invariant ≈ 1
-        assert_close(cycle, ONE, tol="0.001")
+        assert_close(cycle, ONE, tol=Tol.LOOSE)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -141,45 +190,26 @@ class TestWinnerToWinner:
 
 class TestFiatWinner:
 
-    def test_fiat_winner_inverse(self, rates_20260129):
+    @pytest.mark.parametrize("fk,wk", INVERSE_PAIRS)
+    def test_fiat_winner_inverse(self, fk, wk, f2w, w2f):
         """fiat_to_winner[X_COIN] × winner_to_fiat[COIN_X] = 1."""
-        r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-        w2f = kal.compute_winner_to_fiat(r["r_me4u"], r["r_iou2"], r["r_uome"])
-
-        pairs = [
-            ("CNY_ME4U", "ME4U_CNY"),
-            ("USD_ME4U", "ME4U_USD"),
-            ("EUR_ME4U", "ME4U_EUR"),
-            ("USD_IOU2", "IOU2_USD"),
-            ("EUR_IOU2", "IOU2_EUR"),
-            ("CNY_IOU2", "IOU2_CNY"),
-            ("EUR_UOME", "UOME_EUR"),
-            ("USD_UOME", "UOME_USD"),
-            ("CNY_UOME", "UOME_CNY"),
-        ]
-        for fk, wk in pairs:
-            assert_close(f2w[fk] * w2f[wk], ONE, tol="1E-15")
+        assert_close(f2w[fk] * w2f[wk], ONE, tol=Tol.TIGHT)
 
-    def test_identity_coefficients(self, rates_20260129):
+    def test_identity_coefficients(self, f2w):
         """Тождественные коэффициенты = 1 для базовых пар."""
-        r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         assert f2w["CNY_ME4U"] == ONE
         assert f2w["USD_IOU2"] == ONE
         assert f2w["EUR_UOME"] == ONE
 
-    def test_usd_me4u_formula(self, rates_20260129):
+    def test_usd_me4u_formula(self, rates_20260129, f2w):
         """USD→ME4U = 1/r_me4u (spec formula)."""
         r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         expected = ONE / r["r_me4u"]
         assert_close(f2w["USD_ME4U"], expected)
 
-    def test_eur_me4u_formula(self, rates_20260129):
+    def test_eur_me4u_formula(self, rates_20260129, f2w):
         """EUR→ME4U = r_uome (spec formula: 1 EUR = r_uome CNY = r_uome ME4U)."""
         r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
         assert f2w["EUR_ME4U"] == r["r_uome"]
 
 
@@ -189,28 +219,17 @@ class TestFiatWinner:
 
 class TestRubWinner:
 
-    def test_rub_winner_inverse(self, rates_20260129, cbr_sample):
-        r = rates_20260129
-        blocks = kal.compute_rub_winner(
-            r["r_me4u"], r["r_iou2"], r["r_uome"],
-            cbr_sample["USD"], cbr_sample["EUR"], cbr_sample["CNY"],
-        )
-        r2w = blocks["rub_to_winner"]
-        w2r = blocks["winner_to_rub"]
-        # RUB_ME4U × ME4U_RUB = 1
-        assert_close(r2w["RUB_ME4U"] * w2r["ME4U_RUB"], ONE)
-        assert_close(r2w["RUB_IOU2"] * w2r["IOU2_RUB"], ONE)
-        assert_close(r2w["RUB_UOME"] * w2r["UOME_RUB"], ONE)
-
-    def test_rub_me4u_value(self, rates_20260129, cbr_sample):
-        r = rates_20260129
-        blocks = kal.compute_rub_winner(
-            r["r_me4u"], r["r_iou2"], r["r_uome"],
-            cbr_sample["USD"], cbr_sample["EUR"], cbr_sample["CNY"],
-        )
+    @pytest.mark.parametrize("coin", ["ME4U", "IOU2", "UOME"])
+    def test_rub_winner_inverse(self, coin, rub_blocks):
+        """RUB_COIN × COIN_RUB = 1."""
+        r2w = rub_blocks["rub_to_winner"]
+        w2r = rub_blocks["winner_to_rub"]
+        assert_close(r2w[f"RUB_{coin}"] * w2r[f"{coin}_RUB"], ONE)
+
+    def test_rub_me4u_value(self, cbr_sample, rub_blocks):
         # RUB→ME4U = 1/cbr_cny  (1 RUB → 1/12.8000 CNY = 1/12.8 ME4U)
         expected = ONE / cbr_sample["CNY"]
-        assert_close(blocks["rub_to_winner"]["RUB_ME4U"], expected)
+        assert_close(rub_blocks["rub_to_winner"]["RUB_ME4U"], expected)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -219,27 +238,21 @@ class TestRubWinner:
 
 class TestCbrWinner:
 
-    def test_cbr_winner_inverse(self, cbr_sample):
+    @pytest.mark.parametrize("code", CBR_CODES)
+    def test_cbr_winner_inverse(self, code, cbr_blocks):
         """X_WINNER × WINNER_X = 1 для каждого X."""
-        blocks = kal.compute_cbr_to_winner("IOU2", cbr_sample)
-        c2w = blocks["cbr_to_winner"]
-        w2c = blocks["winner_to_cbr"]
-        for code in cbr_sample:
-            key_to = f"{code}_IOU2"
-            key_from = f"IOU2_{code}"
-            if key_to in c2w and key_from in w2c:
-                assert_close(c2w[key_to] * w2c[key_from], ONE)
-
-    def test_usd_iou2_identity(self, cbr_sample):
+        c2w = cbr_blocks["cbr_to_winner"]
+        w2c = cbr_blocks["winner_to_cbr"]
+        assert_close(c2w[f"{code}_IOU2"] * w2c[f"IOU2_{code}"], ONE)
+
+    def test_usd_iou2_identity(self, cbr_blocks):
         """USD→IOU2 через CBR-pivot = cbr_usd/cbr_usd = 1."""
-        blocks = kal.compute_cbr_to_winner("IOU2", cbr_sample)
-        assert_close(blocks["cbr_to_winner"]["USD_IOU2"], ONE)
+        assert_close(cbr_blocks["cbr_to_winner"]["USD_IOU2"], ONE)
 
-    def test_gbp_iou2_formula(self, cbr_sample):
+    def test_gbp_iou2_formula(self, cbr_sample, cbr_blocks):
         """GBP→IOU2 = cbr_gbp / cbr_usd."""
-        blocks = kal.compute_cbr_to_winner("IOU2", cbr_sample)
         expected = cbr_sample["GBP"] / cbr_sample["USD"]
-        assert_close(blocks["cbr_to_winner"]["GBP_IOU2"], expected)
+        assert_close(cbr_blocks["cbr_to_winner"]["GBP_IOU2"], expected)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -248,19 +261,17 @@ class TestCbrWinner:
 
 class TestComputeDay:
 
-    def test_all_blocks_present(self, rates_20260129, cbr_sample):
-        result = kal.compute_day("2026-01-29", rates_20260129, cbr_sample)
+    def test_all_blocks_present(self, day_result):
         expected_keys = {
             "date", "winner", "r_me4u", "r_iou2", "r_uome",
             "winner_to_winner", "fiat_to_winner", "winner_to_fiat",
             "rub_to_winner", "winner_to_rub",
             "cbr_to_winner", "winner_to_cbr",
         }
-        assert expected_keys == set(result.keys())
+        assert expected_keys == set(day_result.keys())
 
-    def test_winner_matches(self, rates_20260129, cbr_sample):
-        result = kal.compute_day("2026-01-29", rates_20260129, cbr_sample)
-        assert result["winner"] == "IOU2"
+    def test_winner_matches(self, day_result):
+        assert day_result["winner"] == "IOU2"
 
     def test_no_cbr_graceful(self, rates_20260129):
         """Без CBR-данных блоки RUB/CBR пустые, но не ошибка."""
@@ -270,16 +281,19 @@ class TestComputeDay:
         assert result["cbr_to_winner"] == {}
         assert result["winner_to_cbr"] == {}
 
-    def test_serialization_no_float(self, rates_20260129, cbr_sample):
+    def test_serialization_no_float(self, day_result):
         """Все числовые значения в JSON — строки, не float."""
-        result = kal.compute_day("2026-01-29", rates_20260129, cbr_sample)
         # Проверяем фиксированные поля
-        assert isinstance(result["r_me4u"], str)
-        assert isinstance(result["r_iou2"], str)
+        assert isinstance(day_result["r_me4u"], str)
+        assert isinstance(day_result["r_iou2"], str)
         # Проверяем вложенные блоки
-        for key in ("winner_to_winner", "fiat_to_winner", "rub_to_winner"):
-            for v in result[key].values():
-                assert isinstance(v, str), f"{key}: значение {v!r} не строка"
+        not_str = [
+            (key, v)
+            for key in ("winner_to_winner", "fiat_to_winner", "rub_to_winner")
+            for v in day_result[key].values()
+            if not isinstance(v, str)
+        ]
+        assert not not_str, f"значения не строки: {not_str!r}"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -288,17 +302,17 @@ class TestComputeDay:
 
 class TestCbrNominals:
 
-    def test_known_nominals(self):
-        noms = kal._cbr_nominals()
+    def test_known_nominals(self, cbr_nominals):
+        noms = cbr_nominals
         assert noms["JPY"] == 100
         assert noms["KRW"] == 1000
         assert noms["USD"] == 1
         assert noms["EUR"] == 1
         assert noms["AMD"] == 100
 
-    def test_normalization(self):
+    def test_normalization(self, cbr_nominals):
         """Проверяем, что 6584 (raw за 100 JPY) → 65.84 за 1 JPY."""
-        noms = kal._cbr_nominals()
+        noms = cbr_nominals
         raw_jpy = _dec("65.8309")  # из cbr_of_rub.json за 2021-07-01
         normalized = raw_jpy / Decimal(str(noms["JPY"]))
         assert_close(normalized, _dec("0.658309"))
@@ -308,36 +322,34 @@ class TestCbrNominals:
 #  Test: ручной расчёт для 2026-01-29
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# Ожидаемые значения из ручного расчёта (разбираются один раз при импорте)
+_G_ME4U = _dec("0.143964")
+_G_IOU2 = _dec("0.835561")
+_G_UOME = _dec("8.313200")
+_G_USD_ME4U = ONE / _G_ME4U
+
+
 class TestGoldenDate20260129:
     """Сверка с ручным расчётом по формулам из спецификации."""
 
-    def test_me4u_iou2(self, rates_20260129):
+    def test_me4u_iou2(self, w2w):
         """ME4U→IOU2 = r_me4u = 0.143964."""
-        r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-        assert_close(w2w["ME4U_IOU2"], _dec("0.143964"))
+        assert_close(w2w["ME4U_IOU2"], _G_ME4U)
 
-    def test_iou2_uome(self, rates_20260129):
+    def test_iou2_uome(self, w2w):
         """IOU2→UOME = r_iou2 = 0.835561."""
-        r = rates_20260129
-        w2w = kal.compute_winner_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-        assert_close(w2w["IOU2_UOME"], _dec("0.835561"))
+        assert_close(w2w["IOU2_UOME"], _G_IOU2)
 
-    def test_usd_me4u(self, rates_20260129):
+    def test_usd_me4u(self, f2w):
         """USD→ME4U = 1/r_me4u = 1/0.143964 ≈ 6.94618…."""
-        r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-        expected = ONE / _dec("0.143964")
-        assert_close(f2w["USD_ME4U"], expected)
+        assert_close(f2w["USD_ME4U"], _G_USD_ME4U)
 
-    def test_eur_me4u(self, rates_20260129):
+    def test_eur_me4u(self, f2w):
         """EUR→ME4U = r_uome = 8.313200."""
-        r = rates_20260129
-        f2w = kal.compute_fiat_to_winner(r["r_me4u"], r["r_iou2"], r["r_uome"])
-        assert_close(f2w["EUR_ME4U"], _dec("8.313200"))
+        assert_close(f2w["EUR_ME4U"], _G_UOME)
 
     def test_kolmo_invariant(self, rates_20260129):
         """r_me4u × r_iou2 × r_uome ≈ 1."""
         r = rates_20260129
         k = r["r_me4u"] * r["r_iou2"] * r["r_uome"]
-        assert_close(k, ONE, tol="0.001")
+        assert_close(k, ONE, tol=Tol.LOOSE)
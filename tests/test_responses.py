@@ -0,0 +1,45 @@
+"""
+API Response Rendering Tests
+
+🔒 REQ-6.3: Decimal values are serialized as exact strings, never floats.
+"""
+
+from decimal import Decimal
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from kolmo.api.responses import KolmoJSONResponse
+
+
+EXACT = Decimal("0.143964000000000000000001")
+
+
+class TestKolmoJSONResponse:
+    """Tests for KolmoJSONResponse."""
+    
+    def test_render_decimal_as_exact_string(self):
+        response = KolmoJSONResponse({"v": EXACT})
+        
+        assert response.body == b'{"v":"0.143964000000000000000001"}'
+    
+    def test_render_uuid_as_string(self):
+        trace_id = UUID("12345678-1234-5678-1234-567812345678")
+        
+        response = KolmoJSONResponse({"trace_id": trace_id})
+        
+        assert response.body == b'{"trace_id":"12345678-1234-5678-1234-567812345678"}'
+    
+    def test_returned_from_route_keeps_decimal_exact(self):
+        """Returned directly, the response bypasses FastAPI's float encoding."""
+        app = FastAPI(default_response_class=KolmoJSONResponse)
+        
+        @app.get("/v")
+        async def value():
+            return KolmoJSONResponse({"v": EXACT})
+        
+        body = TestClient(app).get("/v").json()
+        
+        assert body == {"v": "0.143964000000000000000001"}
+        assert Decimal(body["v"]) == EXACT